@@ -6,7 +6,8 @@ Manages common settings like slide size, colors, margins, etc.
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from dataclasses import dataclass
-from typing import Dict
+from types import MappingProxyType
+from typing import Mapping
 
 
 @dataclass
@@ -53,7 +54,8 @@ class ColorPalette:
     """Color palette"""
     
     def __init__(self):
-        self._colors: Dict[str, RGBColor] = {
+        # Read-only view; palette entries are fixed after construction
+        self._colors: Mapping[str, RGBColor] = MappingProxyType({
             'primary_red': RGBColor(220, 38, 38),      # #dc2626
             'primary_red_light': RGBColor(254, 242, 242),  # #fef2f2
             'primary_red_dark': RGBColor(153, 27, 27),     # #991b1b
@@ -67,13 +69,17 @@ class ColorPalette:
             'black': RGBColor(0, 0, 0),
             'link_blue': RGBColor(0, 102, 204),
             'gray_line': RGBColor(200, 200, 200),
-        }
+        })
+        self._black = self._colors['black']
     
     def __getitem__(self, key: str) -> RGBColor:
-        return self._colors.get(key, self._colors['black'])
+        return self._colors.get(key, self._black)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._colors
     
     def get(self, key: str, default: RGBColor = None) -> RGBColor:
-        return self._colors.get(key, default or self._colors['black'])
+        return self._colors.get(key, default or self._black)
 
 
 # Default settings instances
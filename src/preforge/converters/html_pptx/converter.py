@@ -59,6 +59,7 @@ class HtmlToPptxConverter:
         
         self.prs: Optional[Presentation] = None
         self.html_path: Optional[Path] = None
+        self._blank_layout = None
         
         # Slide builders (initialized during convert)
         self._title_builder: Optional[TitleSlideBuilder] = None
@@ -91,6 +92,7 @@ class HtmlToPptxConverter:
         self.prs = Presentation()
         self.prs.slide_width = self.slide_config.width
         self.prs.slide_height = self.slide_config.height
+        self._blank_layout = self.prs.slide_layouts[6]
         
         # Initialize slide builders
         self._init_builders()
@@ -173,12 +175,45 @@ class HtmlToPptxConverter:
             for gs in sequence_section.find_all('div', class_='gene-section'):
                 sequence_section_ids.add(id(gs))
         
-        gene_sections = content_container.find_all('div', class_='gene-section')
+        # Collect per-section descriptors first, then build slides
+        descriptors = self._collect_gene_sections(content_container, sequence_section_ids)
+        for descriptor in descriptors:
+            self._build_gene_section_slides(descriptor, main_title)
+        
+        # Process standalone h3 sections outside gene-section (e.g., 3.3, 3.4)
+        self._process_standalone_h3_sections(content_container, main_title)
+        
+        # Process Detailed Results section (sequence-section)
+        self._process_sequence_section(content_container)
+        
+        # Process Evidence tables (Source Summary)
+        self._process_evidence_section(content_container)
+    
+    def _collect_gene_sections(
+        self,
+        content_container: Tag,
+        excluded_ids: set
+    ) -> List[dict]:
+        """
+        Collect gene-section descriptors for slide generation
+        
+        Each descriptor carries its own SeqViewerApp offset so sections can be
+        built independently of each other.
+        
+        Args:
+            content_container: content-container element
+            excluded_ids: id() of gene-sections processed elsewhere
+            
+        Returns:
+            List of {'section', 'title', 'viewer_offset', 'viewer_count'} dicts
+        """
+        descriptors = []
         seq_viewer_index = 0
         
+        gene_sections = content_container.find_all('div', class_='gene-section')
         for idx, gene_section in enumerate(gene_sections, 1):
             # Skip gene-sections inside sequence-section (processed separately later)
-            if id(gene_section) in sequence_section_ids:
+            if id(gene_section) in excluded_ids:
                 continue
             
             section_title = self._get_section_title(gene_section, idx)
@@ -188,32 +223,42 @@ class HtmlToPptxConverter:
                 # Evidence sections are processed in _process_evidence_section
                 continue
             
-            # Capture SeqViewerApp screenshots
-            seq_viewers = gene_section.find_all('div', class_='SeqViewerApp', recursive=False)
-            for sv_idx, _ in enumerate(seq_viewers):
-                viewer_title = f"{section_title} - Sequence Viewer"
-                if len(seq_viewers) > 1:
-                    viewer_title += f" ({sv_idx + 1})"
-                self._capture_element_screenshot('.SeqViewerApp', viewer_title, seq_viewer_index)
-                seq_viewer_index += 1
-            
-            # Image processing
-            self._process_images(gene_section, section_title, main_title)
-            
-            # Table processing
-            self._process_tables(gene_section, section_title, main_title)
-            
-            # Subsection processing
-            self._process_subsections(gene_section, main_title)
+            viewer_count = len(
+                gene_section.find_all('div', class_='SeqViewerApp', recursive=False)
+            )
+            descriptors.append({
+                'section': gene_section,
+                'title': section_title,
+                'viewer_offset': seq_viewer_index,
+                'viewer_count': viewer_count
+            })
+            seq_viewer_index += viewer_count
+        
+        return descriptors
+    
+    def _build_gene_section_slides(self, descriptor: dict, main_title: str) -> None:
+        """Build all slides for a single gene-section descriptor"""
+        gene_section = descriptor['section']
+        section_title = descriptor['title']
+        viewer_count = descriptor['viewer_count']
+        
+        # Capture SeqViewerApp screenshots
+        for sv_idx in range(viewer_count):
+            viewer_title = f"{section_title} - Sequence Viewer"
+            if viewer_count > 1:
+                viewer_title += f" ({sv_idx + 1})"
+            self._capture_element_screenshot(
+                '.SeqViewerApp', viewer_title, descriptor['viewer_offset'] + sv_idx
+            )
         
-        # Process standalone h3 sections outside gene-section (e.g., 3.3, 3.4)
-        self._process_standalone_h3_sections(content_container, main_title)
+        # Image processing
+        self._process_images(gene_section, section_title, main_title)
         
-        # Process Detailed Results section (sequence-section)
-        self._process_sequence_section(content_container)
+        # Table processing
+        self._process_tables(gene_section, section_title, main_title)
         
-        # Process Evidence tables (Source Summary)
-        self._process_evidence_section(content_container)
+        # Subsection processing
+        self._process_subsections(gene_section, main_title)
     
     def _get_section_title(self, gene_section: Tag, default_idx: int) -> str:
         """Extract section title"""
@@ -256,10 +301,16 @@ class HtmlToPptxConverter:
         if not tables:
             return
         
-        table_infos = [
-            {'table': t, 'rows': len(t.find_all('tr'))} 
-            for t in tables
-        ]
+        # Only measure tables here; cell text and styles are extracted when a
+        # table is actually drawn (key-value tables never need them).
+        # Grouping counts every <tr>, including those of nested tables.
+        table_infos = []
+        for t in tables:
+            table_infos.append({
+                'table': t,
+                'extractor': TableDataExtractor(t).extract_shape(),
+                'rows': len(t.find_all('tr'))
+            })
         
         # Dynamic grouping
         title_space = Inches(0.85)
@@ -291,24 +342,24 @@ class HtmlToPptxConverter:
             
             if len(current_group) == 1:
                 self._table_builder.create_from_html(
-                    current_group[0]['table'], section_title, main_title
+                    current_group[0]['table'], section_title, main_title,
+                    extractor=current_group[0]['extractor']
                 )
             else:
                 self._create_combined_table_slide(
-                    [info['table'] for info in current_group],
-                    section_title, main_title
+                    current_group, section_title, main_title
                 )
             
             i += 1
     
     def _create_combined_table_slide(
         self, 
-        tables: List[Tag], 
+        group: List[dict], 
         section_title: str, 
         main_title: str
     ) -> None:
         """Combine multiple tables into a single slide"""
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self._blank_layout)
         
         # Add title
         if main_title:
@@ -338,8 +389,8 @@ class HtmlToPptxConverter:
         available_height = self.slide_config.height - current_top - self.slide_config.margin_bottom
         table_builder = TableBuilder(colors=self.colors)
         
-        for table_idx, table_elem in enumerate(tables):
-            extractor = TableDataExtractor(table_elem).extract()
+        for table_idx, info in enumerate(group):
+            extractor = info['extractor'].extract()
             rows = len(extractor.rows_data)
             
             table_height = min(Inches(0.25) * rows, available_height * 0.4)
@@ -372,12 +423,16 @@ class HtmlToPptxConverter:
             h3_title = h3.get_text(strip=True)
             next_table = h3.find_next('table')
             if next_table:
-            # Check if table is within current gene_section
-            table_parent = next_table.parent
-            while table_parent and table_parent != gene_section:
-                table_parent = table_parent.parent
-            if table_parent == gene_section:
-                h3_table_pairs.append({'h3_title': h3_title, 'table': next_table})
+                # Check if table is within current gene_section
+                table_parent = next_table.parent
+                while table_parent and table_parent != gene_section:
+                    table_parent = table_parent.parent
+                if table_parent == gene_section:
+                    h3_table_pairs.append({
+                        'h3_title': h3_title,
+                        'table': next_table,
+                        'extractor': TableDataExtractor(next_table).extract()
+                    })
         
         if not h3_table_pairs:
             return
@@ -391,7 +446,7 @@ class HtmlToPptxConverter:
         main_title: str
     ) -> None:
         """Combine h3 titles and tables into one slide"""
-        slide = self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        slide = self.prs.slides.add_slide(self._blank_layout)
         
         # Main title
         if main_title:
@@ -410,7 +465,7 @@ class HtmlToPptxConverter:
         # Add each h3+table
         for idx, pair in enumerate(h3_table_pairs):
             h3_title = pair['h3_title']
-            table_elem = pair['table']
+            extractor = pair['extractor']
             
             # Add h3 title
             h3_box = slide.shapes.add_textbox(
@@ -427,7 +482,6 @@ class HtmlToPptxConverter:
             current_top += Inches(0.35)
             
             # Add table
-            extractor = TableDataExtractor(table_elem).extract()
             rows = len(extractor.rows_data)
             
             # Calculate remaining space
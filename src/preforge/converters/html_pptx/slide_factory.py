@@ -2,34 +2,383 @@
 Slide creation factory module
 
 Provides functionality to create various types of slides (title, table, image, etc.).
+
+Builders expect HTML parsed with BeautifulSoup(html, 'lxml'), as parsed by
+HtmlToPptxConverter.
 """
 import logging
-import base64
+import binascii
+import importlib.util
+import struct
+from collections import OrderedDict
+from copy import deepcopy
 from io import BytesIO
-from typing import List, Optional, Any
-from bs4 import Tag
+from itertools import islice
+from typing import Dict, List, Optional, Any, Tuple
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 from pptx import Presentation
-from pptx.util import Inches, Pt
+from pptx.util import Emu, Inches, Pt
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.dml.color import RGBColor
+from pptx.oxml.ns import qn
 
-try:
-    from PIL import Image
-    HAS_PIL = True
-except ImportError:
-    HAS_PIL = False
+# PIL is imported lazily by ImageSlideBuilder; only probe for it here
+HAS_PIL = importlib.util.find_spec('PIL') is not None
 
 from .config import SlideConfig, ColorPalette, DEFAULT_SLIDE_CONFIG, DEFAULT_COLORS
-from .table_builder import TableBuilder, TableDataExtractor
+from .table_builder import (
+    TableBuilder,
+    TableDataExtractor,
+    TableBorderStyler,
+    _style_cell_text,
+    _style_link_runs,
+)
 from .style_utils import TextUtils
 
 logger = logging.getLogger(__name__)
 
+# Precomputed EMU lengths for layout constants reused on every slide
+_IN_0_1 = Inches(0.1)
+_IN_0_12 = Inches(0.12)
+_IN_0_2 = Inches(0.2)
+_IN_0_25 = Inches(0.25)
+_IN_0_3 = Inches(0.3)
+_IN_0_35 = Inches(0.35)
+_IN_0_4 = Inches(0.4)
+_IN_0_5 = Inches(0.5)
+_IN_0_6 = Inches(0.6)
+_IN_0_7 = Inches(0.7)
+_IN_0_8 = Inches(0.8)
+_IN_0_9 = Inches(0.9)
+_IN_1 = Inches(1)
+_IN_1_2 = Inches(1.2)
+_IN_1_3 = Inches(1.3)
+_IN_1_5 = Inches(1.5)
+_IN_1_6 = Inches(1.6)
+_IN_2 = Inches(2)
+_IN_4 = Inches(4)
+_PT_1 = Pt(1)
+_PT_2 = Pt(2)
+_PT_3 = Pt(3)
+_PT_7 = Pt(7)
+_PT_9 = Pt(9)
+_PT_10 = Pt(10)
+_PT_11 = Pt(11)
+_PT_12 = Pt(12)
+_PT_13 = Pt(13)
+_PT_16 = Pt(16)
+_PT_18 = Pt(18)
+_PT_20 = Pt(20)
+_PT_32 = Pt(32)
+_PT_40 = Pt(40)
+
+
+def _walk_evidence(
+    evidence_div: Tag,
+    max_headers: int = 8
+) -> Tuple[Optional[List[str]], List[List[Tag]]]:
+    """
+    Walk an evidence-table div once, collecting header strings and data rows
+    
+    Data rows are the evidence-cells of the first evidence-row, or every
+    evidence-cell when no evidence-row exists. Like a per-cell find_all(),
+    an evidence-text counts for every evidence-cell that encloses it.
+    
+    Args:
+        evidence_div: evidence-table div
+        max_headers: Maximum number of header strings to read
+        
+    Returns:
+        (header strings or None, list of evidence-text elements per evidence-cell)
+    """
+    header_div = None
+    row_cells = None
+    all_cells = []
+    
+    # (node, inside first evidence-row, evidence-text lists of all enclosing cells)
+    stack = [(child, False, ()) for child in reversed(evidence_div.contents)]
+    while stack:
+        node, in_row, enclosing = stack.pop()
+        if not isinstance(node, Tag):
+            continue
+        
+        if node.name == 'div':
+            classes = node.get('class') or ()
+            if 'evidence-text' in classes:
+                for cell_texts in enclosing:
+                    cell_texts.append(node)
+            if 'evidence-header' in classes and header_div is None:
+                header_div = node
+            if 'evidence-row' in classes and row_cells is None:
+                row_cells = []
+                in_row = True
+            if 'evidence-cell' in classes:
+                cell_texts = []
+                all_cells.append(cell_texts)
+                if in_row:
+                    row_cells.append(cell_texts)
+                enclosing += (cell_texts,)
+        
+        stack.extend((child, in_row, enclosing) for child in reversed(node.contents))
+    
+    headers = None
+    if header_div is not None:
+        headers = [elem.strip() for elem in islice(header_div.stripped_strings, max_headers)]
+    
+    return headers, row_cells if row_cells is not None else all_cells
+
+
+def _find_first_by_class(parent: Tag, tag: str, classes: Tuple[str, ...]) -> Dict[str, Tag]:
+    """
+    Find the first descendant of each class in a single tree walk
+    
+    Equivalent to calling parent.find(tag, class_=cls) for every class,
+    but stops as soon as all classes have been found.
+    
+    Args:
+        parent: Element to search under
+        tag: Tag name
+        classes: Class names to look for
+        
+    Returns:
+        Dictionary of class name -> first matching element (missing classes omitted)
+    """
+    found = {}
+    wanted = set(classes)
+    for node in parent.descendants:
+        if node.name != tag:
+            continue
+        node_classes = node.get('class')
+        if not node_classes:
+            continue
+        for cls in node_classes:
+            if cls in wanted:
+                found[cls] = node
+                wanted.discard(cls)
+        if not wanted:
+            break
+    return found
+
+
+def _apply_uniform_cell_formatting(tbl_element, margin_lr: int, margin_tb: int) -> None:
+    """
+    Set margins, middle anchor and no fill on every cell in one XML pass
+    
+    Writes the <a:tcPr> attributes directly instead of going through the
+    per-cell python-pptx property setters.
+    
+    Args:
+        tbl_element: <a:tbl> element (Table._tbl)
+        margin_lr: Left/right cell margin (EMU)
+        margin_tb: Top/bottom cell margin (EMU)
+    """
+    for tc in tbl_element.iter(qn('a:tc')):
+        tcPr = tc.get_or_add_tcPr()
+        tcPr.anchor = MSO_ANCHOR.MIDDLE
+        tcPr.marL = margin_lr
+        tcPr.marR = margin_lr
+        tcPr.marT = margin_tb
+        tcPr.marB = margin_tb
+        tcPr.get_or_change_to_noFill()
+
+
+def _fit_image(
+    img_width: int,
+    img_height: int,
+    avail_w: float,
+    avail_h: float,
+    margin_left: float
+) -> Tuple[float, float, float, float]:
+    """
+    Scale an image to fit the available area, keeping its aspect ratio, and center it
+    
+    Args:
+        img_width: Image width in pixels
+        img_height: Image height in pixels
+        avail_w: Available width (EMU)
+        avail_h: Available height (EMU), starting 0.7 inch from the top
+        margin_left: Left edge of the available area (EMU)
+        
+    Returns:
+        (left, top, width, height) in EMU
+    """
+    img_ratio = img_width / img_height
+    
+    if img_ratio > avail_w / avail_h:
+        final_width = avail_w
+        final_height = avail_w / img_ratio
+    else:
+        final_height = avail_h
+        final_width = avail_h * img_ratio
+    
+    # Center alignment
+    img_left = margin_left + (avail_w - final_width) / 2
+    img_top = _IN_0_7 + (avail_h - final_height) / 2
+    return img_left, img_top, final_width, final_height
+
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+# JPEG start-of-frame markers (excluding DHT, JPG and DAC)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _sniff_image_size(mime: str, data: bytes) -> Optional[Tuple[int, int]]:
+    """
+    Read (width, height) from PNG/JPEG/GIF headers without decoding pixels
+    
+    Args:
+        mime: MIME type from the data URI
+        data: Encoded image bytes
+        
+    Returns:
+        (width, height) or None if the format is not handled or malformed
+    """
+    if mime == 'image/png':
+        if len(data) >= 24 and data[:8] == _PNG_SIGNATURE and data[12:16] == b'IHDR':
+            return struct.unpack('>II', data[16:24])
+        return None
+    
+    if mime in ('image/jpeg', 'image/jpg'):
+        if data[:2] != b'\xff\xd8':
+            return None
+        i = 2
+        length = len(data)
+        while i + 9 <= length:
+            if data[i] != 0xFF:
+                i += 1
+                continue
+            marker = data[i + 1]
+            if marker in _JPEG_SOF_MARKERS:
+                height, width = struct.unpack('>HH', data[i + 5:i + 9])
+                return width, height
+            if marker == 0xFF:
+                # Fill byte
+                i += 1
+            elif marker == 0x01 or 0xD0 <= marker <= 0xD8:
+                # Standalone markers without length
+                i += 2
+            else:
+                i += 2 + struct.unpack('>H', data[i + 2:i + 4])[0]
+        return None
+    
+    if mime == 'image/gif':
+        if data[:6] in (b'GIF87a', b'GIF89a') and len(data) >= 10:
+            return struct.unpack('<HH', data[6:10])
+        return None
+    
+    return None
+
+
+def _set_body_margins(text_frame, left: int, right: int, top: int, bottom: int) -> None:
+    """Set all four text frame insets on <a:bodyPr> with a single lookup"""
+    bodyPr = text_frame._txBody.bodyPr
+    bodyPr.lIns = left
+    bodyPr.rIns = right
+    bodyPr.tIns = top
+    bodyPr.bIns = bottom
+
+
+def _clone_text_shape(sp_tree, template_sp, shape_id: int, top: int, text: str) -> None:
+    """
+    Append a copy of a styled single-paragraph shape with a new id, top and text
+    
+    The copy is identical to building the shape again through python-pptx
+    (same fill, line, insets and paragraph properties), without the per-shape
+    descriptor calls.
+    
+    Args:
+        sp_tree: <p:spTree> of the slide
+        template_sp: <p:sp> element to copy
+        shape_id: Unique shape id for the copy
+        top: Top position (EMU)
+        text: Paragraph text
+    """
+    sp = deepcopy(template_sp)
+    cNvPr = sp.nvSpPr.cNvPr
+    cNvPr.id = shape_id
+    cNvPr.name = "Rectangle %d" % (shape_id - 1)
+    sp.y = top
+    p = sp.txBody.p_lst[0]
+    for elm in p.content_children:
+        p.remove(elm)
+    p.append_text(text)
+    sp_tree.insert_element_before(sp, 'p:extLst')
+
+
+def _fill_solid_rect(slide, left, top, width, height, rgb: RGBColor):
+    """Add a borderless rectangle with a solid fill"""
+    shape = slide.shapes.add_shape(MSO_SHAPE.RECTANGLE, left, top, width, height)
+    shape.fill.solid()
+    shape.fill.fore_color.rgb = rgb
+    shape.line.fill.background()
+    return shape
+
+
+def _set_first_paragraph_font(
+    frame,
+    size: int,
+    rgb: RGBColor,
+    bold: Optional[bool] = None,
+    align=None
+) -> None:
+    """
+    Style the first paragraph of a text frame with direct <a:pPr>/<a:defRPr> writes
+    
+    Produces the same markup as the paragraph.font / paragraph.alignment
+    setters without building the Font and ColorFormat proxies.
+    
+    Args:
+        frame: python-pptx TextFrame
+        size: Font size (EMU)
+        rgb: Font color
+        bold: Bold flag (None leaves it unset)
+        align: PP_ALIGN value (None leaves it unset)
+    """
+    pPr = frame._txBody.p_lst[0].get_or_add_pPr()
+    if align is not None:
+        pPr.algn = align
+    defRPr = pPr.get_or_add_defRPr()
+    defRPr.sz = Emu(size).centipoints
+    if bold is not None:
+        defRPr.b = bold
+    defRPr.get_or_change_to_solidFill().get_or_change_to_srgbClr().val = str(rgb)
+
+
+def _style_all_paragraphs(frame, size: int, rgb: RGBColor, line_spacing: float) -> None:
+    """
+    Apply the same font size, color and line spacing to every paragraph of a text frame
+    
+    Args:
+        frame: python-pptx TextFrame
+        size: Font size (EMU)
+        rgb: Font color
+        line_spacing: Line spacing multiple
+    """
+    size_cp = Emu(size).centipoints
+    rgb_hex = str(rgb)
+    for p in frame._txBody.p_lst:
+        pPr = p.get_or_add_pPr()
+        defRPr = pPr.get_or_add_defRPr()
+        defRPr.sz = size_cp
+        defRPr.get_or_change_to_solidFill().get_or_change_to_srgbClr().val = rgb_hex
+        pPr.line_spacing = line_spacing
+
+
+def _set_centered_text(frame, text: str, size: int, rgb: RGBColor, bold: bool = False) -> None:
+    """Set a single centered paragraph on a text frame"""
+    frame.text = text
+    _set_first_paragraph_font(frame, size, rgb, True if bold else None, PP_ALIGN.CENTER)
+
 
 class SlideFactory:
     """Slide creation factory"""
     
+    __slots__ = (
+        'prs', 'config', 'colors',
+        '_table_builder', '_border_styler', '_blank_layout', '_content_bottom'
+    )
+    
     def __init__(
         self,
         presentation: Presentation,
@@ -39,11 +388,29 @@ class SlideFactory:
         self.prs = presentation
         self.config = slide_config or DEFAULT_SLIDE_CONFIG
         self.colors = colors or DEFAULT_COLORS
-        self.table_builder = TableBuilder(colors=colors)
+        self._table_builder: Optional[TableBuilder] = None
+        self._border_styler: Optional[TableBorderStyler] = None
+        self._blank_layout = presentation.slide_layouts[6]
+        # Bottom edge of the content area
+        self._content_bottom = self.config.height - self.config.margin_bottom
+    
+    @property
+    def table_builder(self) -> TableBuilder:
+        """Table builder (created on first use; only table slides need it)"""
+        if self._table_builder is None:
+            self._table_builder = TableBuilder(colors=self.colors)
+        return self._table_builder
+    
+    @property
+    def border_styler(self) -> TableBorderStyler:
+        """Table border styler (created on first use)"""
+        if self._border_styler is None:
+            self._border_styler = TableBorderStyler(colors=self.colors)
+        return self._border_styler
     
     def _get_blank_slide(self):
         """Create blank layout slide"""
-        return self.prs.slides.add_slide(self.prs.slide_layouts[6])
+        return self.prs.slides.add_slide(self._blank_layout)
     
     def _add_title(
         self, 
@@ -55,21 +422,18 @@ class SlideFactory:
         color: RGBColor = None
     ) -> float:
         """Add title to slide"""
-        top = top if top is not None else self.config.margin_top - Inches(0.2)
+        top = top if top is not None else self.config.margin_top - _IN_0_2
         color = color or self.colors['primary_red']
         
         title_box = slide.shapes.add_textbox(
             self.config.margin_left, top,
-            self.config.content_width, Inches(0.5)
+            self.config.content_width, _IN_0_5
         )
         title_frame = title_box.text_frame
         title_frame.text = text
-        title_para = title_frame.paragraphs[0]
-        title_para.font.size = font_size
-        title_para.font.bold = bold
-        title_para.font.color.rgb = color
+        _set_first_paragraph_font(title_frame, font_size, color, bold)
         
-        return top + Inches(0.5)
+        return top + _IN_0_5
     
     def _add_subtitle(
         self, 
@@ -80,68 +444,42 @@ class SlideFactory:
         color: RGBColor = None
     ) -> float:
         """Add subtitle to slide"""
-        top = top if top is not None else Inches(0.1)
+        top = top if top is not None else _IN_0_1
         color = color or self.colors['gray_600']
         
         subtitle_box = slide.shapes.add_textbox(
             self.config.margin_left, top,
-            self.config.content_width, Inches(0.25)
+            self.config.content_width, _IN_0_25
         )
         subtitle_frame = subtitle_box.text_frame
         subtitle_frame.text = text
-        subtitle_para = subtitle_frame.paragraphs[0]
-        subtitle_para.font.size = font_size
-        subtitle_para.font.color.rgb = color
+        _set_first_paragraph_font(subtitle_frame, font_size, color)
         
-        return top + Inches(0.3)
+        return top + _IN_0_3
 
 
 class TitleSlideBuilder(SlideFactory):
     """Title slide builder"""
     
+    __slots__ = ()
+    
     def create(self, title: str, subtitle: str = "") -> Any:
         """Create title slide"""
         slide = self._get_blank_slide()
+        width = self.config.width
         
         # Background
-        background = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            0, 0,
-            self.config.width, self.config.height
-        )
-        background.fill.solid()
-        background.fill.fore_color.rgb = self.colors['gray_50']
-        background.line.fill.background()
-        
-        # Top red box
-        header_box = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            0, Inches(2),
-            self.config.width, Inches(1.5)
-        )
-        header_box.fill.solid()
-        header_box.fill.fore_color.rgb = self.colors['primary_red']
-        header_box.line.fill.background()
-        
-        # Title text
-        title_frame = header_box.text_frame
-        title_frame.text = title
-        title_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-        title_frame.paragraphs[0].font.size = Pt(40)
-        title_frame.paragraphs[0].font.bold = True
-        title_frame.paragraphs[0].font.color.rgb = self.colors['white']
+        _fill_solid_rect(slide, 0, 0, width, self.config.height, self.colors['gray_50'])
+        
+        # Top red box with title text
+        header_box = _fill_solid_rect(slide, 0, _IN_2, width, _IN_1_5, self.colors['primary_red'])
+        _set_centered_text(header_box.text_frame, title, _PT_40, self.colors['white'], bold=True)
         
         # Subtitle
         if subtitle:
-            subtitle_box = slide.shapes.add_textbox(
-                Inches(1), Inches(4),
-                self.config.width - Inches(2), Inches(1.5)
-            )
+            subtitle_box = slide.shapes.add_textbox(_IN_1, _IN_4, width - _IN_2, _IN_1_5)
             subtitle_frame = subtitle_box.text_frame
-            subtitle_frame.text = subtitle
-            subtitle_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-            subtitle_frame.paragraphs[0].font.size = Pt(16)
-            subtitle_frame.paragraphs[0].font.color.rgb = self.colors['gray_800']
+            _set_centered_text(subtitle_frame, subtitle, _PT_16, self.colors['gray_800'])
             subtitle_frame.word_wrap = True
         
         return slide
@@ -150,6 +488,8 @@ class TitleSlideBuilder(SlideFactory):
 class ContentSlideBuilder(SlideFactory):
     """General content slide builder"""
     
+    __slots__ = ()
+    
     def create_with_text(
         self, 
         title: str, 
@@ -159,38 +499,32 @@ class ContentSlideBuilder(SlideFactory):
         """Create text content slide"""
         slide = self._get_blank_slide()
         
-        y_position = self.config.margin_top - Inches(0.2)
+        y_position = self.config.margin_top - _IN_0_2
         
         # Title
-        y_position = self._add_title(slide, title, Pt(32), y_position)
+        y_position = self._add_title(slide, title, _PT_32, y_position)
         
         # Subtitle
         if subtitle:
             subtitle_box = slide.shapes.add_textbox(
                 self.config.margin_left, y_position,
-                self.config.content_width, Inches(0.3)
+                self.config.content_width, _IN_0_3
             )
             subtitle_frame = subtitle_box.text_frame
             subtitle_frame.text = subtitle
-            subtitle_para = subtitle_frame.paragraphs[0]
-            subtitle_para.font.size = Pt(20)
-            subtitle_para.font.bold = True
-            subtitle_para.font.color.rgb = self.colors['gray_800']
-            y_position += Inches(0.4)
+            _set_first_paragraph_font(subtitle_frame, _PT_20, self.colors['gray_800'], True)
+            y_position += _IN_0_4
         
         # Body
         text_box = slide.shapes.add_textbox(
-            self.config.margin_left, y_position + Inches(0.2),
-            self.config.content_width, Inches(4)
+            self.config.margin_left, y_position + _IN_0_2,
+            self.config.content_width, _IN_4
         )
         text_frame = text_box.text_frame
         text_frame.text = content
         text_frame.word_wrap = True
         
-        for paragraph in text_frame.paragraphs:
-            paragraph.font.size = Pt(12)
-            paragraph.font.color.rgb = self.colors['gray_800']
-            paragraph.line_spacing = 1.5
+        _style_all_paragraphs(text_frame, _PT_12, self.colors['gray_800'], 1.5)
         
         return slide
 
@@ -198,6 +532,19 @@ class ContentSlideBuilder(SlideFactory):
 class TableSlideBuilder(SlideFactory):
     """Table slide builder"""
     
+    __slots__ = ('max_rows_per_slide',)
+    
+    # Key-value card colors
+    _LABEL_BG = RGBColor(55, 65, 81)
+    _VALUE_BG = RGBColor(249, 250, 251)
+    _BORDER = RGBColor(209, 213, 219)
+    _WHITE = RGBColor(255, 255, 255)
+    
+    # Key-value card geometry
+    _CARD_HEIGHT = _IN_1_3
+    _CARD_SPACING = _IN_0_12
+    _LABEL_WIDTH = _IN_1_6
+    
     def __init__(
         self,
         presentation: Presentation,
@@ -208,28 +555,60 @@ class TableSlideBuilder(SlideFactory):
         super().__init__(presentation, slide_config, colors)
         self.max_rows_per_slide = max_rows_per_slide
     
+    def create_from_raw_html(
+        self,
+        raw_html: str,
+        title: str,
+        main_title: str = ""
+    ) -> List[Any]:
+        """
+        Parse only the <table> subtrees of raw HTML and create slides for each table
+        
+        Uses SoupStrainer so no Tag/NavigableString objects are built for the
+        surrounding markup (scripts, styles, layout divs).
+        
+        Args:
+            raw_html: HTML source
+            title: Slide title
+            main_title: Main title
+            
+        Returns:
+            List of created slides
+        """
+        soup = BeautifulSoup(raw_html, 'lxml', parse_only=SoupStrainer('table'))
+        
+        slides = []
+        # Top-level tables only; nested tables are part of their parent's cells
+        for table_elem in soup.find_all('table', recursive=False):
+            slides.extend(self.create_from_html(table_elem, title, main_title))
+        return slides
+    
     def create_from_html(
         self, 
         table_elem: Tag, 
         title: str,
-        main_title: str = ""
+        main_title: str = "",
+        extractor: Optional[TableDataExtractor] = None
     ) -> List[Any]:
         """Create slides from HTML table (auto-split)"""
-        # Extract table data first
-        extractor = TableDataExtractor(table_elem).extract()
+        # Measure the table first (reuse caller's extraction if provided);
+        # cell text/styles are only extracted when a real table is drawn
+        if extractor is None:
+            extractor = TableDataExtractor(table_elem)
+        extractor.extract_shape()
         
         # If splitting is needed - check before slide creation
-        header_count = len(extractor.header_rows)
-        body_count = len(extractor.body_rows)
+        body_count = extractor.body_row_count
         
-        y_position = self.config.margin_top - Inches(0.2)
+        y_position = self.config.margin_top - _IN_0_2
         if main_title:
-            y_position = Inches(0.35)
-        table_top = y_position + Inches(0.5)
-        table_height = self.config.height - table_top - self.config.margin_bottom
+            y_position = _IN_0_35
+        table_top = y_position + _IN_0_5
+        table_height = self._content_bottom - table_top
         
         if body_count > self.max_rows_per_slide:
             # Create separate slides when splitting
+            extractor.extract()
             return self._create_split_table_slides(
                 extractor, title, main_title, table_top, table_height
             )
@@ -239,10 +618,10 @@ class TableSlideBuilder(SlideFactory):
         
         # Main title
         if main_title:
-            self._add_subtitle(slide, main_title, Pt(12), Inches(0.1))
+            self._add_subtitle(slide, main_title, _PT_12, _IN_0_1)
         
         # Section title
-        self._add_title(slide, title, Pt(18), y_position)
+        self._add_title(slide, title, _PT_18, y_position)
         
         # Display in card style if key-value table
         if extractor.is_key_value_table():
@@ -254,10 +633,11 @@ class TableSlideBuilder(SlideFactory):
             return [slide]
         
         # Single slide table
+        extractor.extract()
         self.table_builder.create_table(
             slide,
             extractor.rows_data,
-            header_count,
+            len(extractor.header_rows),
             extractor.col_widths_html,
             self.config.margin_left, table_top,
             self.config.content_width, table_height,
@@ -277,50 +657,67 @@ class TableSlideBuilder(SlideFactory):
     ) -> List[Any]:
         """Create split table slides"""
         slides = []
-        header_count = len(extractor.header_rows)
+        header_rows = extractor.header_rows
+        header_count = len(header_rows)
         body_rows = extractor.body_rows
+        body_count = len(body_rows)
+        rows_per_slide = self.max_rows_per_slide
         
-        num_chunks = (len(body_rows) + self.max_rows_per_slide - 1) // self.max_rows_per_slide
+        num_chunks = (body_count + rows_per_slide - 1) // rows_per_slide
         
-        for chunk_idx in range(num_chunks):
-            start_idx = chunk_idx * self.max_rows_per_slide
-            end_idx = min(start_idx + self.max_rows_per_slide, len(body_rows))
-            
-            chunk_data = extractor.header_rows + body_rows[start_idx:end_idx]
-            
-            # Filter merge_info for this chunk
-            chunk_merge_info = []
-            for row_idx, col_idx, colspan, rowspan in extractor.merge_info:
-                if row_idx < header_count:
-                    chunk_merge_info.append((row_idx, col_idx, colspan, rowspan))
-                elif row_idx - header_count >= start_idx and row_idx - header_count < end_idx:
-                    new_row_idx = header_count + (row_idx - header_count - start_idx)
-                    chunk_merge_info.append((new_row_idx, col_idx, colspan, rowspan))
-            
-            # Filter cell_styles for this chunk
-            chunk_cell_styles = {}
-            for (r, c), styles in extractor.cell_styles.items():
-                if r < header_count:
-                    chunk_cell_styles[(r, c)] = styles
-                elif r - header_count >= start_idx and r - header_count < end_idx:
-                    new_r = header_count + (r - header_count - start_idx)
-                    chunk_cell_styles[(new_r, c)] = styles
+        # Partition merge_info / cell_styles by chunk in a single pass
+        # (header entries are repeated on every chunk)
+        header_merges = []
+        merges_by_chunk = [[] for _ in range(num_chunks)]
+        for row_idx, col_idx, colspan, rowspan in extractor.merge_info:
+            if row_idx < header_count:
+                header_merges.append((row_idx, col_idx, colspan, rowspan))
+                continue
+            chunk_idx, offset = divmod(row_idx - header_count, rows_per_slide)
+            if chunk_idx < num_chunks:
+                merges_by_chunk[chunk_idx].append(
+                    (header_count + offset, col_idx, colspan, rowspan)
+                )
+        
+        header_styles = {}
+        styles_by_chunk = [{} for _ in range(num_chunks)]
+        for (r, c), styles in extractor.cell_styles.items():
+            if r < header_count:
+                header_styles[(r, c)] = styles
+                continue
+            chunk_idx, offset = divmod(r - header_count, rows_per_slide)
+            if chunk_idx < num_chunks:
+                styles_by_chunk[chunk_idx][(header_count + offset, c)] = styles
+        
+        # Slide titles: "(continued N)" after the first slide
+        titles = [title] + [f"{title} (continued {i + 1})" for i in range(1, num_chunks)]
+        
+        # Loop-invariant table placement
+        table_builder = self.table_builder
+        col_widths = extractor.col_widths_html
+        margin_left = self.config.margin_left
+        content_width = self.config.content_width
+        chunk_table_height = self.config.height - _IN_0_9
+        
+        for chunk_idx, start_idx in enumerate(range(0, body_count, rows_per_slide)):
+            chunk_data = header_rows + body_rows[start_idx:start_idx + rows_per_slide]
+            chunk_merge_info = header_merges + merges_by_chunk[chunk_idx]
+            chunk_cell_styles = {**header_styles, **styles_by_chunk[chunk_idx]}
             
             # Create slide
             slide = self._get_blank_slide()
             
-            # Title (add "(continued N)" after first slide)
-            slide_title = title if chunk_idx == 0 else f"{title} (continued {chunk_idx + 1})"
-            self._add_title(slide, slide_title, Pt(18), Inches(0.1))
+            slide_title = titles[chunk_idx]
+            self._add_title(slide, slide_title, _PT_18, _IN_0_1)
             
             # Create table
-            self.table_builder.create_table(
+            table_builder.create_table(
                 slide,
                 chunk_data,
                 header_count,
-                extractor.col_widths_html,
-                self.config.margin_left, Inches(0.6),
-                self.config.content_width, self.config.height - Inches(0.9),
+                col_widths,
+                margin_left, _IN_0_6,
+                content_width, chunk_table_height,
                 chunk_merge_info,
                 chunk_cell_styles
             )
@@ -343,73 +740,90 @@ class TableSlideBuilder(SlideFactory):
         if not tbody:
             return []
         
-        rows = tbody.find_all('tr')
+        # <tr>/<td> are direct children; filter .children instead of
+        # running find_all's tag matcher over them
+        rows = [child for child in tbody.children if child.name == 'tr']
         if not rows:
             return []
         
-        label_bg_color = RGBColor(55, 65, 81)
-        value_bg_color = RGBColor(249, 250, 251)
-        border_color = RGBColor(209, 213, 219)
-        
         y_position = top
-        card_height = Inches(1.3)
-        card_spacing = Inches(0.12)
-        label_width = Inches(1.6)
+        card_height = self._CARD_HEIGHT
+        card_spacing = self._CARD_SPACING
+        label_width = self._LABEL_WIDTH
+        
+        # Loop-invariant values
+        label_bg_color = self._LABEL_BG
+        value_bg_color = self._VALUE_BG
+        border_color = self._BORDER
+        label_text_color = self._WHITE
+        value_text_color = self.colors['gray_800']
+        label_font_size = _PT_13
+        value_font_size = _PT_11
+        margin_tb = _PT_10
+        label_margin_lr = _PT_10
+        value_margin_lr = _PT_12
+        value_left = left + label_width
+        value_width = width - label_width
+        clean_text = TextUtils.clean_text
+        
+        sp_tree = slide.shapes._spTree
+        card_template = None
+        next_shape_id = 0
         
         for tr in rows:
-            cells = tr.find_all(['th', 'td'])
+            cells = [child for child in tr.children if child.name in ('th', 'td')]
             if len(cells) < 2:
                 continue
             
-            label = TextUtils.clean_text(cells[0].get_text(strip=True))
-            value = TextUtils.clean_text(cells[1].get_text(strip=True))
-            
-            # Label area
-            label_shape = slide.shapes.add_shape(
-                MSO_SHAPE.RECTANGLE,
-                left, y_position,
-                label_width, card_height
-            )
-            label_shape.fill.solid()
-            label_shape.fill.fore_color.rgb = label_bg_color
-            label_shape.line.fill.background()
-            
-            label_tf = label_shape.text_frame
-            label_tf.word_wrap = True
-            label_tf.paragraphs[0].text = label
-            label_tf.paragraphs[0].font.size = Pt(13)
-            label_tf.paragraphs[0].font.bold = True
-            label_tf.paragraphs[0].font.color.rgb = RGBColor(255, 255, 255)
-            label_tf.paragraphs[0].alignment = PP_ALIGN.CENTER
-            label_shape.text_frame.margin_left = Pt(10)
-            label_shape.text_frame.margin_right = Pt(10)
-            label_shape.text_frame.margin_top = Pt(10)
-            label_shape.text_frame.margin_bottom = Pt(10)
-            
-            # Value area
-            value_left = left + label_width
-            value_width = width - label_width
-            
-            value_shape = slide.shapes.add_shape(
-                MSO_SHAPE.RECTANGLE,
-                value_left, y_position,
-                value_width, card_height
-            )
-            value_shape.fill.solid()
-            value_shape.fill.fore_color.rgb = value_bg_color
-            value_shape.line.color.rgb = border_color
-            value_shape.line.width = Pt(1)
+            label = clean_text(cells[0].get_text(strip=True))
+            value = clean_text(cells[1].get_text(strip=True))
             
-            value_tf = value_shape.text_frame
-            value_tf.word_wrap = True
-            value_tf.paragraphs[0].text = value
-            value_tf.paragraphs[0].font.size = Pt(11)
-            value_tf.paragraphs[0].font.color.rgb = self.colors['gray_800']
-            value_tf.paragraphs[0].alignment = PP_ALIGN.LEFT
-            value_shape.text_frame.margin_left = Pt(12)
-            value_shape.text_frame.margin_right = Pt(12)
-            value_shape.text_frame.margin_top = Pt(10)
-            value_shape.text_frame.margin_bottom = Pt(10)
+            if card_template is None:
+                # First card is built through python-pptx and becomes the template
+                # Label area
+                label_shape = slide.shapes.add_shape(
+                    MSO_SHAPE.RECTANGLE,
+                    left, y_position,
+                    label_width, card_height
+                )
+                label_shape.fill.solid()
+                label_shape.fill.fore_color.rgb = label_bg_color
+                label_shape.line.fill.background()
+                
+                label_tf = label_shape.text_frame
+                label_tf.word_wrap = True
+                label_tf.paragraphs[0].text = label
+                _set_first_paragraph_font(
+                    label_tf, label_font_size, label_text_color, True, PP_ALIGN.CENTER
+                )
+                _set_body_margins(label_tf, label_margin_lr, label_margin_lr, margin_tb, margin_tb)
+                
+                # Value area
+                value_shape = slide.shapes.add_shape(
+                    MSO_SHAPE.RECTANGLE,
+                    value_left, y_position,
+                    value_width, card_height
+                )
+                value_shape.fill.solid()
+                value_shape.fill.fore_color.rgb = value_bg_color
+                value_shape.line.color.rgb = border_color
+                value_shape.line.width = _PT_1
+                
+                value_tf = value_shape.text_frame
+                value_tf.word_wrap = True
+                value_tf.paragraphs[0].text = value
+                _set_first_paragraph_font(
+                    value_tf, value_font_size, value_text_color, align=PP_ALIGN.LEFT
+                )
+                _set_body_margins(value_tf, value_margin_lr, value_margin_lr, margin_tb, margin_tb)
+                
+                card_template = (label_shape._element, value_shape._element)
+                next_shape_id = value_shape.shape_id + 1
+            else:
+                # Later cards: copy the styled shapes, change id, position and text
+                _clone_text_shape(sp_tree, card_template[0], next_shape_id, y_position, label)
+                _clone_text_shape(sp_tree, card_template[1], next_shape_id + 1, y_position, value)
+                next_shape_id += 2
             
             y_position += card_height + card_spacing
         
@@ -419,55 +833,57 @@ class TableSlideBuilder(SlideFactory):
 class ImageSlideBuilder(SlideFactory):
     """Image slide builder"""
     
+    __slots__ = ('_image_cache',)
+    
+    # Decoded images kept for repeated data URIs (least recently used evicted)
+    _IMAGE_CACHE_SIZE = 8
+    
+    def __init__(
+        self,
+        presentation: Presentation,
+        slide_config: SlideConfig = None,
+        colors: ColorPalette = None
+    ):
+        super().__init__(presentation, slide_config, colors)
+        # data URI -> (embeddable image bytes, width, height)
+        self._image_cache: Dict[str, Tuple[bytes, int, int]] = OrderedDict()
+    
+    def _image_box(self, img_width: int, img_height: int) -> Tuple[float, float, float, float]:
+        """Fit an image into the content area below the title"""
+        return _fit_image(
+            img_width, img_height,
+            self.config.content_width, self.config.height - _IN_1_2,
+            self.config.margin_left
+        )
+    
     def create_from_base64(self, img_tag: Tag, title: str) -> Optional[Any]:
         """Create slide from Base64 image"""
-        if not HAS_PIL:
-            logger.warning("Cannot create image slide because PIL is not installed")
-            return None
-        
         src = img_tag.get('src', '')
-        if not src.startswith('data:image'):
+        comma = src.find(',')
+        if not src.startswith('data:image') or comma < 0:
             return None
         
         try:
-            header, data = src.split(',', 1)
-            img_bytes = base64.b64decode(data)
-            pil_img = Image.open(BytesIO(img_bytes))
-            img_width, img_height = pil_img.size
+            image_cache = self._image_cache
+            cached = image_cache.get(src)
+            if cached is None:
+                cached = self._decode_data_uri(src, comma)
+                if cached is None:
+                    return None
+                image_cache[src] = cached
+                if len(image_cache) > self._IMAGE_CACHE_SIZE:
+                    image_cache.popitem(last=False)
+            else:
+                image_cache.move_to_end(src)
+            img_bytes, img_width, img_height = cached
+            img_stream = BytesIO(img_bytes)
             
             slide = self._get_blank_slide()
             
             # Title
-            self._add_title(slide, title or "Analysis Chart", Pt(20), Inches(0.2))
-            
-            # Calculate image size
-            available_width = self.config.content_width
-            available_height = self.config.height - Inches(1.2)
-            
-            img_ratio = img_width / img_height
-            available_ratio = available_width / available_height
+            self._add_title(slide, title or "Analysis Chart", _PT_20, _IN_0_2)
             
-            if img_ratio > available_ratio:
-                final_width = available_width
-                final_height = available_width / img_ratio
-            else:
-                final_height = available_height
-                final_width = available_height * img_ratio
-            
-            # Center alignment
-            img_left = self.config.margin_left + (available_width - final_width) / 2
-            img_top = Inches(0.7) + (available_height - final_height) / 2
-            
-            # Save and add image
-            img_stream = BytesIO()
-            pil_img.save(img_stream, format='PNG')
-            img_stream.seek(0)
-            
-            slide.shapes.add_picture(
-                img_stream,
-                img_left, img_top,
-                final_width, final_height
-            )
+            slide.shapes.add_picture(img_stream, *self._image_box(img_width, img_height))
             
             logger.info(f"Image slide created: {title} ({img_width}x{img_height})")
             return slide
@@ -476,40 +892,55 @@ class ImageSlideBuilder(SlideFactory):
             logger.error(f"Failed to create image slide: {e}")
             return None
     
+    @staticmethod
+    def _decode_data_uri(src: str, comma: int) -> Optional[Tuple[bytes, int, int]]:
+        """
+        Decode a base64 image data URI into embeddable bytes and pixel size
+        
+        Args:
+            src: data:image/...;base64,... URI
+            comma: Index of the comma separating header and payload
+            
+        Returns:
+            (image bytes, width, height) or None if PIL is needed but missing
+        """
+        # Decode straight from a view of the encoded URI (no payload str copy)
+        mime = src[:comma].split(';')[0].split(':')[1]
+        img_bytes = binascii.a2b_base64(memoryview(src.encode('ascii'))[comma + 1:])
+        
+        # PNG/JPEG/GIF are embedded as-is; other formats are re-encoded as PNG
+        size = _sniff_image_size(mime, img_bytes)
+        if size is not None:
+            return img_bytes, size[0], size[1]
+        
+        if not HAS_PIL:
+            logger.warning("Cannot create image slide because PIL is not installed")
+            return None
+        from PIL import Image
+        
+        pil_img = Image.open(BytesIO(img_bytes))
+        img_width, img_height = pil_img.size
+        img_stream = BytesIO()
+        # Fast zlib level: slightly larger PNG, much cheaper encode
+        pil_img.save(img_stream, format='PNG', compress_level=1)
+        return img_stream.getvalue(), img_width, img_height
+    
     def create_from_file(self, image_path: str, title: str) -> Optional[Any]:
         """Create image slide from file"""
         if not HAS_PIL:
             return None
+        from PIL import Image
         
         try:
-            pil_img = Image.open(image_path)
-            img_width, img_height = pil_img.size
+            # Header-only read; close before python-pptx opens the file itself
+            with Image.open(image_path) as pil_img:
+                img_width, img_height = pil_img.size
             
             slide = self._get_blank_slide()
             
-            self._add_title(slide, title, Pt(20), Inches(0.2))
-            
-            available_width = self.config.content_width
-            available_height = self.config.height - Inches(1.2)
+            self._add_title(slide, title, _PT_20, _IN_0_2)
             
-            img_ratio = img_width / img_height
-            available_ratio = available_width / available_height
-            
-            if img_ratio > available_ratio:
-                final_width = available_width
-                final_height = available_width / img_ratio
-            else:
-                final_height = available_height
-                final_width = available_height * img_ratio
-            
-            img_left = self.config.margin_left + (available_width - final_width) / 2
-            img_top = Inches(0.7) + (available_height - final_height) / 2
-            
-            slide.shapes.add_picture(
-                image_path,
-                img_left, img_top,
-                final_width, final_height
-            )
+            slide.shapes.add_picture(image_path, *self._image_box(img_width, img_height))
             
             return slide
             
@@ -521,50 +952,33 @@ class ImageSlideBuilder(SlideFactory):
 class SectionSlideBuilder(SlideFactory):
     """Section divider slide builder (intermediate title)"""
     
+    __slots__ = ()
+    
     def create(self, title: str, subtitle: str = "") -> Any:
         """Create section divider slide"""
         slide = self._get_blank_slide()
+        width = self.config.width
+        height = self.config.height
         
         # Background
-        background = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            0, 0,
-            self.config.width, self.config.height
-        )
-        background.fill.solid()
-        background.fill.fore_color.rgb = self.colors['gray_50']
-        background.line.fill.background()
-        
-        # Center section title box
-        title_height = Inches(1.2)
-        title_box = slide.shapes.add_shape(
-            MSO_SHAPE.RECTANGLE,
-            0, (self.config.height - title_height) / 2,
-            self.config.width, title_height
+        _fill_solid_rect(slide, 0, 0, width, height, self.colors['gray_50'])
+        
+        # Center section title box with title text
+        title_height = _IN_1_2
+        title_box = _fill_solid_rect(
+            slide, 0, (height - title_height) / 2, width, title_height,
+            self.colors['primary_red']
         )
-        title_box.fill.solid()
-        title_box.fill.fore_color.rgb = self.colors['primary_red']
-        title_box.line.fill.background()
-        
-        # Section title text
-        title_tf = title_box.text_frame
-        title_tf.text = title
-        title_tf.paragraphs[0].alignment = PP_ALIGN.CENTER
-        title_tf.paragraphs[0].font.size = Pt(32)
-        title_tf.paragraphs[0].font.bold = True
-        title_tf.paragraphs[0].font.color.rgb = self.colors['white']
+        _set_centered_text(title_box.text_frame, title, _PT_32, self.colors['white'], bold=True)
         
         # Subtitle
         if subtitle:
             subtitle_box = slide.shapes.add_textbox(
-                Inches(1), (self.config.height + title_height) / 2 + Inches(0.2),
-                self.config.width - Inches(2), Inches(0.8)
+                _IN_1, (height + title_height) / 2 + _IN_0_2,
+                width - _IN_2, _IN_0_8
             )
             subtitle_frame = subtitle_box.text_frame
-            subtitle_frame.text = subtitle
-            subtitle_frame.paragraphs[0].alignment = PP_ALIGN.CENTER
-            subtitle_frame.paragraphs[0].font.size = Pt(16)
-            subtitle_frame.paragraphs[0].font.color.rgb = self.colors['gray_600']
+            _set_centered_text(subtitle_frame, subtitle, _PT_16, self.colors['gray_600'])
             subtitle_frame.word_wrap = True
         
         return slide
@@ -573,19 +987,27 @@ class SectionSlideBuilder(SlideFactory):
 class ReferenceCardSlideBuilder(SlideFactory):
     """Reference card slide builder"""
     
+    __slots__ = ()
+    
     def create(self, reference_card: Tag, section_title: str = "") -> Optional[Any]:
         """Create slide from reference card"""
         slide = self._get_blank_slide()
         
-        y_position = self.config.margin_top - Inches(0.2)
+        y_position = self.config.margin_top - _IN_0_2
         
         # Section title (small text)
         if section_title:
-            self._add_subtitle(slide, section_title, Pt(11), Inches(0.1))
-            y_position = Inches(0.35)
+            self._add_subtitle(slide, section_title, _PT_11, _IN_0_1)
+            y_position = _IN_0_35
+        
+        # Locate number/meta/summary blocks in one pass
+        parts = _find_first_by_class(
+            reference_card, 'div',
+            ('reference-number', 'reference-meta', 'reference-summary')
+        )
         
         # Extract reference title (from reference-number)
-        ref_number = reference_card.find('div', class_='reference-number')
+        ref_number = parts.get('reference-number')
         if ref_number:
             ref_title = ref_number.get_text(strip=True)
         else:
@@ -594,55 +1016,57 @@ class ReferenceCardSlideBuilder(SlideFactory):
         # Title (Reference title)
         title_box = slide.shapes.add_textbox(
             self.config.margin_left, y_position,
-            self.config.content_width, Inches(0.6)
+            self.config.content_width, _IN_0_6
         )
         title_frame = title_box.text_frame
         title_frame.word_wrap = True
         title_frame.text = ref_title
-        title_para = title_frame.paragraphs[0]
-        title_para.font.size = Pt(16)
-        title_para.font.bold = True
-        title_para.font.color.rgb = self.colors['primary_red']
+        _set_first_paragraph_font(title_frame, _PT_16, self.colors['primary_red'], True)
         
-        y_position += Inches(0.7)
+        y_position += _IN_0_7
         
         # Meta information (journal, date, etc.)
-        ref_meta = reference_card.find('div', class_='reference-meta')
+        ref_meta = parts.get('reference-meta')
         if ref_meta:
             meta_text = ref_meta.get_text(strip=True)
             meta_box = slide.shapes.add_textbox(
                 self.config.margin_left, y_position,
-                self.config.content_width, Inches(0.3)
+                self.config.content_width, _IN_0_3
             )
             meta_frame = meta_box.text_frame
             meta_frame.text = meta_text
-            meta_para = meta_frame.paragraphs[0]
-            meta_para.font.size = Pt(10)
-            meta_para.font.color.rgb = self.colors['gray_600']
-            y_position += Inches(0.4)
+            _set_first_paragraph_font(meta_frame, _PT_10, self.colors['gray_600'])
+            y_position += _IN_0_4
         
         # Summary content
-        ref_summary = reference_card.find('div', class_='reference-summary')
+        ref_summary = parts.get('reference-summary')
         if ref_summary:
-            # Clean summary text
-            summary_text = ref_summary.get_text(separator='\n', strip=True)
+            # Clean summary text, reading only as many strings as the limit needs
+            # (same result as get_text(separator='\n', strip=True) + truncation)
+            summary_parts = []
+            summary_len = -1
+            for part in ref_summary.stripped_strings:
+                summary_parts.append(part)
+                summary_len += len(part) + 1
+                if summary_len > 1500:
+                    break
+            summary_text = '\n'.join(summary_parts)
             # Length limit
+            # Slicing is by code point; ASCII summaries (the common case) cut
+            # cleanly, non-ASCII ones may split a combining sequence or emoji
             if len(summary_text) > 1500:
                 summary_text = summary_text[:1500] + "..."
             
             summary_box = slide.shapes.add_textbox(
                 self.config.margin_left, y_position,
                 self.config.content_width,
-                self.config.height - y_position - self.config.margin_bottom
+                self._content_bottom - y_position
             )
             summary_frame = summary_box.text_frame
             summary_frame.word_wrap = True
             summary_frame.text = summary_text
             
-            for paragraph in summary_frame.paragraphs:
-                paragraph.font.size = Pt(9)
-                paragraph.font.color.rgb = self.colors['gray_800']
-                paragraph.line_spacing = 1.3
+            _style_all_paragraphs(summary_frame, _PT_9, self.colors['gray_800'], 1.3)
         
         return slide
 
@@ -650,20 +1074,16 @@ class ReferenceCardSlideBuilder(SlideFactory):
 class EvidenceSlideBuilder(SlideFactory):
     """Evidence table slide builder"""
     
+    __slots__ = ()
+    
     def create(self, evidence_div: Tag, title: str) -> Optional[Any]:
         """Create evidence table slide"""
         slide = self._get_blank_slide()
         
-        self._add_title(slide, title, Pt(18))
+        self._add_title(slide, title, _PT_18)
         
-        # Find evidence-cell inside evidence-row or directly
-        evidence_row = evidence_div.find('div', class_='evidence-row')
-        if evidence_row:
-            # Use evidence-cells inside evidence-row as data rows
-            data_rows = evidence_row.find_all('div', class_='evidence-cell')
-        else:
-            # If evidence-row not found, find evidence-cell directly
-            data_rows = evidence_div.find_all('div', class_='evidence-cell')
+        # Collect header and evidence-cell rows in a single tree walk
+        headers, data_rows = _walk_evidence(evidence_div)
         
         if not data_rows:
             return slide
@@ -672,19 +1092,17 @@ class EvidenceSlideBuilder(SlideFactory):
         
         # Extract table data
         table_data = []
-        link_data = []
+        link_cells = set()
         
         # Extract header
-        header_div = evidence_div.find('div', class_='evidence-header')
-        if header_div:
-            headers = [elem.strip() for elem in header_div.stripped_strings]
-            if headers:
-                table_data.append(headers[:8])
-        
-        # Extract data rows
-        for row_idx, row in enumerate(data_rows[:max_rows]):
+        if headers:
+            table_data.append(headers)
+        
+        # Extract data rows (plain cells are cleaned in one batch afterwards)
+        pending_cells = []
+        pending_texts = []
+        for row_idx, text_elements in enumerate(data_rows[:max_rows]):
             row_texts = []
-            text_elements = row.find_all('div', class_='evidence-text')
             
             for col_idx, elem in enumerate(text_elements[:8]):
                 link = elem.find('a')
@@ -693,31 +1111,36 @@ class EvidenceSlideBuilder(SlideFactory):
                     link_url = link.get('href', '')
                     row_texts.append(link_text)
                     if link_url:
-                        link_data.append((len(table_data), col_idx, link_url))
+                        link_cells.add((len(table_data), col_idx))
                 else:
-                    text = TextUtils.clean_text(elem.get_text(strip=True))
-                    text = TextUtils.truncate_text(text, 80)
-                    row_texts.append(text)
+                    pending_cells.append((row_texts, len(row_texts)))
+                    pending_texts.append(elem.get_text(strip=True))
+                    row_texts.append('')
             
             if row_texts:
                 table_data.append(row_texts)
         
+        cleaned = TextUtils.clean_and_truncate_batch(pending_texts, 80)
+        for (row_texts, col_idx), text in zip(pending_cells, cleaned):
+            row_texts[col_idx] = text
+        
         if len(table_data) <= 1:
             return slide
         
         # Normalize column count
-        max_cols = max(len(row) for row in table_data)
+        max_cols = max(map(len, table_data))
         for row in table_data:
-            while len(row) < max_cols:
-                row.append('')
+            pad = max_cols - len(row)
+            if pad:
+                row.extend([''] * pad)
         
         # Create table - adjust height based on row count
-        table_top = self.config.margin_top + Inches(0.4)
-        max_table_height = self.config.height - table_top - self.config.margin_bottom
+        table_top = self.config.margin_top + _IN_0_4
+        max_table_height = self._content_bottom - table_top
         
         # Calculate row height (header: 0.3 inch, data: 0.4 inch)
         num_rows = len(table_data)
-        row_height = Inches(0.4)
+        row_height = _IN_0_4
         calculated_height = row_height * num_rows
         
         # Use smaller of calculated height and max height
@@ -730,59 +1153,51 @@ class EvidenceSlideBuilder(SlideFactory):
                 self.config.content_width, table_height
             ).table
             
-            # Fill data
-            for i, row_data in enumerate(table_data):
+            # Loop-invariant values
+            black = self.colors['black']
+            gray_800 = self.colors['gray_800']
+            link_blue = self.colors['link_blue']
+            font_size = _PT_7
+            cell_margin_lr = _PT_3
+            cell_margin_tb = _PT_2
+            
+            # Margins, anchor and fill are the same for every cell
+            _apply_uniform_cell_formatting(ppt_table._tbl, cell_margin_lr, cell_margin_tb)
+            
+            size_cp = font_size.centipoints
+            black_hex = str(black)
+            gray_800_hex = str(gray_800)
+            link_hex = str(link_blue)
+            
+            def prepare_cell(i: int, j: int, cell_data: str):
+                cell = ppt_table.cell(i, j)
+                cell.text = str(cell_data)
+                return cell._tc
+            
+            # Fill header row (first row)
+            for j, cell_data in enumerate(table_data[0]):
+                tc = prepare_cell(0, j, cell_data)
+                _style_cell_text(tc, size_cp, black_hex, PP_ALIGN.CENTER, wrap=False, bold=True)
+                
+                # Header-less tables put the first data row here
+                if (0, j) in link_cells:
+                    _style_link_runs(tc, link_hex)
+            
+            # Fill data rows
+            for i, row_data in enumerate(table_data[1:], 1):
                 for j, cell_data in enumerate(row_data):
-                    if j >= max_cols:
-                        continue
-                    
-                    cell = ppt_table.cell(i, j)
-                    cell.text = str(cell_data)
-                    cell.vertical_anchor = MSO_ANCHOR.MIDDLE
-                    
-                    cell.margin_left = Pt(3)
-                    cell.margin_right = Pt(3)
-                    cell.margin_top = Pt(2)
-                    cell.margin_bottom = Pt(2)
+                    tc = prepare_cell(i, j, cell_data)
+                    alignment = PP_ALIGN.LEFT if j in (2, 5) else PP_ALIGN.CENTER
+                    if cell_data == 'Link':
+                        _style_cell_text(tc, size_cp, link_hex, alignment, wrap=True, underline=True)
+                    else:
+                        _style_cell_text(tc, size_cp, gray_800_hex, alignment, wrap=True)
                     
-                    cell.fill.background()
-                    
-                    for paragraph in cell.text_frame.paragraphs:
-                        paragraph.font.size = Pt(7)
-                        
-                        if i == 0:
-                            paragraph.font.bold = True
-                            paragraph.font.color.rgb = self.colors['black']
-                            paragraph.alignment = PP_ALIGN.CENTER
-                            cell.text_frame.word_wrap = False
-                        else:
-                            paragraph.font.color.rgb = self.colors['gray_800']
-                            cell.text_frame.word_wrap = True
-                            
-                            if j in [2, 5]:
-                                paragraph.alignment = PP_ALIGN.LEFT
-                            else:
-                                paragraph.alignment = PP_ALIGN.CENTER
-                            
-                            if cell_data == 'Link':
-                                paragraph.font.color.rgb = self.colors['link_blue']
-                                paragraph.font.underline = True
-            
-            # Apply link styles
-            for row_idx, col_idx, url in link_data:
-                try:
-                    cell = ppt_table.cell(row_idx, col_idx)
-                    for paragraph in cell.text_frame.paragraphs:
-                        for run in paragraph.runs:
-                            run.font.color.rgb = self.colors['link_blue']
-                            run.font.underline = True
-                except Exception:
-                    pass
+                    if (i, j) in link_cells:
+                        _style_link_runs(tc, link_hex)
             
             # Apply borders
-            from .table_builder import TableBorderStyler
-            border_styler = TableBorderStyler(colors=self.colors)
-            border_styler.apply_academic_borders(ppt_table, 1, len(table_data), max_cols)
+            self.border_styler.apply_academic_borders(ppt_table, 1, len(table_data), max_cols)
             
         except Exception as e:
             logger.error(f"Failed to create evidence table: {e}")
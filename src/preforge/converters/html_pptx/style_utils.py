@@ -2,12 +2,108 @@
 Style extraction and application utilities
 
 Provides functionality to extract styles from HTML elements and apply them to PowerPoint elements.
+
+Tags passed in are expected to come from BeautifulSoup(html, 'lxml'), as parsed by
+HtmlToPptxConverter.
 """
 import re
-from typing import Dict, Any, Optional, List
-from bs4 import Tag
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
+from bs4 import NavigableString, Tag
 from pptx.dml.color import RGBColor
 
+# Precompiled patterns (used per table cell)
+_COLOR_VALUE = r'#[a-fA-F0-9]{6}|#[a-fA-F0-9]{3}|rgb\([^)]+\)'
+_COLOR_RE = re.compile(r'color:\s*(' + _COLOR_VALUE + r')')
+# color, background(-color) and font-weight in one scan; match.lastgroup names the property
+_STYLE_RE = re.compile(
+    r'background(?P<bg_color>-color)?:\s*(?P<bg>' + _COLOR_VALUE + r')'
+    r'|color:\s*(?P<color>' + _COLOR_VALUE + r')'
+    r'|font-weight:\s*(?P<weight>\w+)'
+)
+_RGB_CALL_RE = re.compile(r'rgb\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)')
+_WIDTH_RE = re.compile(r'width:\s*(\d+)')
+_WIDTH_ATTR_RE = re.compile(r'\s*(\d+)(?:px|%)?\s*')
+# Formatted cell text cleanup: blank-line runs -> '\n', space/tab runs -> ' '
+# (a lone ' ' is already clean, so only runs that actually change are matched)
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+_SPACE_TAB_RE = re.compile(r' [ \t]+|\t[ \t]*')
+
+# One RGBColor per distinct color value (see _rgb_color)
+_RGB_INTERN: Dict[int, RGBColor] = {}
+_RGB_INTERN_MAX = 4096
+
+_BLOCK_END = object()
+# Tags with special handling in extract_cell_text_with_formatting
+_FORMAT_TAG_KINDS = {
+    'br': 'br',
+    'ul': 'list',
+    'ol': 'list',
+    'li': 'li',
+    'p': 'block',
+    'div': 'block',
+}
+
+
+@lru_cache(maxsize=1024)
+def _parse_style_attr(style_attr: str) -> Tuple[Optional[RGBColor], Optional[RGBColor], bool]:
+    """Parse color, background-color and bold from a style attribute (cached per string)"""
+    color_value = bg_value = weight = None
+    for match in _STYLE_RE.finditer(style_attr):
+        kind = match.lastgroup
+        if kind == 'bg':
+            if bg_value is None:
+                bg_value = match.group('bg')
+            # 'background-color: x' also counts as 'color: x'
+            if color_value is None and match.group('bg_color'):
+                color_value = match.group('bg')
+        elif kind == 'color':
+            if color_value is None:
+                color_value = match.group('color')
+        elif weight is None:
+            weight = match.group('weight')
+    
+    parse_color = StyleExtractor.parse_color
+    return (
+        parse_color(color_value) if color_value else None,
+        parse_color(bg_value) if bg_value else None,
+        weight in ('bold', '700', '800', '900'),
+    )
+
+
+def _rgb_color(value: int) -> RGBColor:
+    """
+    Shared RGBColor for a 24-bit 0xRRGGBB value
+    
+    '#fff', '#ffffff' and 'rgb(255, 255, 255)' all map to one instance;
+    the table is reset if a document somehow uses more than _RGB_INTERN_MAX colors.
+    """
+    color = _RGB_INTERN.get(value)
+    if color is None:
+        color = RGBColor(value >> 16, (value >> 8) & 0xFF, value & 0xFF)
+        if len(_RGB_INTERN) >= _RGB_INTERN_MAX:
+            _RGB_INTERN.clear()
+        _RGB_INTERN[value] = color
+    return color
+
+
+def _cell_width(cell: Tag) -> Optional[int]:
+    """Width of one cell from its style (width: N) or width attribute, else None"""
+    attrs = cell.attrs
+    # Extract width from style attribute
+    style = attrs.get('style', '')
+    if 'width:' in style:
+        match = _WIDTH_RE.search(style)
+        return int(match.group(1)) if match else None
+    
+    # Check width attribute directly ('120', '120px', '30%')
+    width = attrs.get('width')
+    if width:
+        match = _WIDTH_ATTR_RE.fullmatch(width)
+        if match:
+            return int(match.group(1))
+    return None
+
 
 class StyleExtractor:
     """Class that extracts style information from HTML elements"""
@@ -32,53 +128,46 @@ class StyleExtractor:
         
         style_attr = cell_elem.get('style', '')
         
-        # Extract color
-        color_match = re.search(
-            r'color:\s*(#[a-fA-F0-9]{6}|#[a-fA-F0-9]{3}|rgb\([^)]+\))', 
-            style_attr
-        )
-        if color_match:
-            styles['color'] = StyleExtractor.parse_color(color_match.group(1))
+        # Extract color, background-color and font-weight (first of each wins);
+        # most cells carry no inline style, so skip the scan on a cheap miss
+        if style_attr and ('color' in style_attr or 'background' in style_attr
+                           or 'font-weight' in style_attr):
+            color, background, bold = _parse_style_attr(style_attr)
+            styles['color'] = color
+            styles['background'] = background
+            styles['bold'] = bold
         
-        # Extract background-color
-        bg_match = re.search(
-            r'background(?:-color)?:\s*(#[a-fA-F0-9]{6}|#[a-fA-F0-9]{3}|rgb\([^)]+\))', 
-            style_attr
-        )
-        if bg_match:
-            styles['background'] = StyleExtractor.parse_color(bg_match.group(1))
+        # One descendant walk for bold tags (b, strong), the first inner
+        # element with a style attribute (span, etc.) and the first link
+        has_bold = False
+        need_style = True
+        link = None
+        for desc in cell_elem.descendants:
+            name = desc.name
+            if name is None:
+                continue
+            if not has_bold and name in ('b', 'strong'):
+                has_bold = True
+            if need_style and 'style' in desc.attrs:
+                need_style = False
+                if not styles['color']:
+                    inner_color = _COLOR_RE.search(desc.attrs['style'])
+                    if inner_color:
+                        styles['color'] = StyleExtractor.parse_color(inner_color.group(1))
+            if link is None and name == 'a':
+                link = desc
+            if has_bold and not need_style and link is not None:
+                break
         
-        # Check font-weight
-        if 'font-weight' in style_attr:
-            weight_match = re.search(r'font-weight:\s*(\w+)', style_attr)
-            if weight_match:
-                weight = weight_match.group(1)
-                if weight in ('bold', '700', '800', '900'):
-                    styles['bold'] = True
-        
-        # Check for bold tags (b, strong)
-        if cell_elem.find(['b', 'strong']):
+        if has_bold:
             styles['bold'] = True
-        
-        # Check for color styles in inner elements (span, etc.)
-        colored_elem = cell_elem.find(style=True)
-        if colored_elem and not styles['color']:
-            inner_style = colored_elem.get('style', '')
-            inner_color = re.search(
-                r'color:\s*(#[a-fA-F0-9]{6}|#[a-fA-F0-9]{3}|rgb\([^)]+\))', 
-                inner_style
-            )
-            if inner_color:
-                styles['color'] = StyleExtractor.parse_color(inner_color.group(1))
-        
-        # Check for link
-        link = cell_elem.find('a')
-        if link:
+        if link is not None:
             styles['link'] = link.get('href', '')
         
         return styles
     
     @staticmethod
+    @lru_cache(maxsize=256)
     def parse_color(color_str: str) -> Optional[RGBColor]:
         """
         Convert color string to RGBColor
@@ -87,35 +176,31 @@ class StyleExtractor:
             color_str: Color string in '#rrggbb', '#rgb', 'rgb(r, g, b)' format
             
         Returns:
-            RGBColor object or None
+            RGBColor object or None (cached per color string)
         """
-        if not color_str:
+        # Keywords ('red', 'inherit', 'transparent', ...) are not supported
+        if not color_str or not color_str.startswith(('#', 'rgb')):
             return None
         
-        try:
-            # hex color (#rrggbb or #rgb)
-            if color_str.startswith('#'):
-                hex_color = color_str[1:]
-                if len(hex_color) == 3:
-                    hex_color = ''.join([c * 2 for c in hex_color])
-                r = int(hex_color[0:2], 16)
-                g = int(hex_color[2:4], 16)
-                b = int(hex_color[4:6], 16)
-                return RGBColor(r, g, b)
-            
-            # rgb(r, g, b)
-            if color_str.startswith('rgb'):
-                match = re.search(
-                    r'rgb\s*\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)', 
-                    color_str
-                )
-                if match:
-                    r = int(match.group(1))
-                    g = int(match.group(2))
-                    b = int(match.group(3))
-                    return RGBColor(r, g, b)
-        except Exception:
-            pass
+        # hex color (#rrggbb or #rgb)
+        if color_str[0] == '#':
+            hex_color = color_str[1:]
+            if len(hex_color) == 3:
+                hex_color = ''.join([c * 2 for c in hex_color])
+            if len(hex_color) < 6:
+                return None
+            try:
+                return _rgb_color(int(hex_color[:6], 16))
+            except ValueError:
+                return None
+        
+        # rgb(r, g, b)
+        match = _RGB_CALL_RE.search(color_str)
+        if match:
+            r, g, b = int(match.group(1)), int(match.group(2)), int(match.group(3))
+            if r > 255 or g > 255 or b > 255:
+                return None
+            return _rgb_color((r << 16) | (g << 8) | b)
         
         return None
     
@@ -130,27 +215,7 @@ class StyleExtractor:
         Returns:
             List of cell widths (in pixels, None if not specified)
         """
-        widths = []
-        for cell in cells:
-            width = None
-            
-            # Extract width from style attribute
-            style = cell.get('style', '')
-            if 'width:' in style:
-                match = re.search(r'width:\s*(\d+)(?:px|%)?', style)
-                if match:
-                    width = int(match.group(1))
-            
-            # Check width attribute directly
-            elif cell.get('width'):
-                try:
-                    width = int(cell.get('width').replace('px', '').replace('%', ''))
-                except ValueError:
-                    pass
-            
-            widths.append(width)
-        
-        return widths
+        return [_cell_width(cell) for cell in cells]
 
 
 class TextUtils:
@@ -169,9 +234,9 @@ class TextUtils:
         """
         if not text:
             return ""
-        # Multiple whitespace to single
-        text = re.sub(r'\s+', ' ', text)
-        return text.strip()
+        # Multiple whitespace to single; str.split() splits on exactly the
+        # characters \s matches and drops the leading/trailing runs
+        return ' '.join(text.split())
     
     @staticmethod
     def extract_cell_text_with_formatting(cell_elem) -> str:
@@ -184,68 +249,100 @@ class TextUtils:
         Returns:
             Text with formatting preserved
         """
-        from bs4 import NavigableString
-        
         if not cell_elem:
             return ""
         
         result_parts = []
+        append = result_parts.append
+        # Explicit DFS stack (last item is processed next). Besides nodes it
+        # holds literal prefixes (plain str) and _BLOCK_END markers that close
+        # a p/div once its children are done.
+        stack = list(reversed(cell_elem.contents))
+        pop = stack.pop
+        extend = stack.extend
         
-        def process_element(elem, bullet_prefix=""):
-            """Process element recursively"""
-            if isinstance(elem, NavigableString):
-                text = str(elem).strip()
-                if text:
-                    result_parts.append(text)
-                return
+        while stack:
+            elem = pop()
+            
+            if elem is _BLOCK_END:
+                # Add line break for block elements
+                if result_parts and result_parts[-1] != '\n':
+                    append('\n')
+                continue
+            
+            cls = elem.__class__
+            if cls is str:
+                append(elem)
+                continue
             
-            tag_name = getattr(elem, 'name', None)
+            # Exact class compare first; isinstance only for Comment/CData etc.
+            if cls is NavigableString or (cls is not Tag and isinstance(elem, NavigableString)):
+                text = elem.strip()
+                if text:
+                    append(text)
+                continue
             
-            if tag_name == 'br':
-                result_parts.append('\n')
-            elif tag_name == 'ul':
-                # Process li inside ul
-                for li in elem.find_all('li', recursive=False):
-                    result_parts.append('\n• ')
-                    for child in li.children:
-                        process_element(child)
-            elif tag_name == 'ol':
-                # Process li inside ol (numbered)
-                for idx, li in enumerate(elem.find_all('li', recursive=False), 1):
-                    result_parts.append(f'\n{idx}. ')
-                    for child in li.children:
-                        process_element(child)
-            elif tag_name == 'li':
+            # Most nodes are inline tags (span, b, a, ...) that only need
+            # their children walked: one dict probe instead of an if/elif chain
+            tag_name = elem.name
+            kind = _FORMAT_TAG_KINDS.get(tag_name)
+            if kind is None:
+                contents = elem.contents
+                if contents:
+                    extend(reversed(contents))
+            elif kind == 'br':
+                append('\n')
+            elif kind == 'list':
+                # Process li inside ul (bullets) or ol (numbered)
+                items = []
+                idx = 0
+                for li in elem.contents:
+                    if li.name != 'li':
+                        continue
+                    idx += 1
+                    items.append('\n• ' if tag_name == 'ul' else f'\n{idx}. ')
+                    items.extend(li.contents)
+                extend(reversed(items))
+            elif kind == 'li':
                 # Standalone li outside ul/ol
-                result_parts.append('\n• ')
-                for child in elem.children:
-                    process_element(child)
-            elif tag_name in ('p', 'div'):
-                # Add line break for block elements
-                for child in elem.children:
-                    process_element(child)
-                if result_parts and not result_parts[-1].endswith('\n'):
-                    result_parts.append('\n')
+                append('\n• ')
+                extend(reversed(elem.contents))
             else:
-                # Process children for other elements
-                if hasattr(elem, 'children'):
-                    for child in elem.children:
-                        process_element(child)
-        
-        # Process all children of the cell
-        for child in cell_elem.children:
-            process_element(child)
+                # Add line break for block elements (p, div) after children
+                stack.append(_BLOCK_END)
+                extend(reversed(elem.contents))
         
-        # Clean up result
-        text = ''.join(result_parts)
-        # Clean up consecutive line breaks
-        text = re.sub(r'\n\s*\n', '\n', text)
-        # Remove leading/trailing whitespace and line breaks
-        text = text.strip()
-        # Multiple spaces to single (excluding line breaks)
-        text = re.sub(r'[ \t]+', ' ', text)
+        # Clean up consecutive line breaks, collapse spaces/tabs, then remove
+        # leading/trailing whitespace and line breaks
+        text = _BLANK_LINES_RE.sub('\n', ''.join(result_parts))
+        return _SPACE_TAB_RE.sub(' ', text).strip()
+    
+    @staticmethod
+    def clean_and_truncate_batch(
+        texts: List[str],
+        max_length: int = 100,
+        suffix: str = "..."
+    ) -> List[str]:
+        """
+        Clean and truncate many strings in one call (clean_text + truncate_text)
         
-        return text
+        Args:
+            texts: Original texts
+            max_length: Maximum length
+            suffix: Suffix to append when truncated
+            
+        Returns:
+            Cleaned and truncated texts, in the same order
+        """
+        clean = TextUtils.clean_text
+        cut = max_length - len(suffix)
+        result = []
+        for text in texts:
+            text = clean(text)
+            if len(text) > max_length:
+                text = text[:cut] + suffix
+            result.append(text)
+        return result
     
     @staticmethod
     def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
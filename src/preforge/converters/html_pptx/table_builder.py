@@ -4,10 +4,12 @@ Table creation and styling module
 Handles PowerPoint table creation, border styling, column width adjustment, etc.
 """
 import logging
+import re
+from copy import deepcopy
 from typing import List, Optional, Dict, Any, Tuple
 from bs4 import Tag
 from pptx.util import Inches, Pt
-from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+from pptx.enum.text import PP_ALIGN, MSO_ANCHOR, MSO_UNDERLINE
 from pptx.dml.color import RGBColor
 from lxml import etree
 from pptx.oxml.ns import qn
@@ -24,6 +26,84 @@ from .style_utils import StyleExtractor, TextUtils
 
 logger = logging.getLogger(__name__)
 
+# Hangul syllables (counted as wider glyphs when sizing columns)
+_HANGUL_RE = re.compile('[\uAC00-\uD7A3]+')
+
+# Cell border element tags by side
+_BORDER_TAGS = {
+    'top': qn('a:lnT'),
+    'bottom': qn('a:lnB'),
+    'left': qn('a:lnL'),
+    'right': qn('a:lnR'),
+}
+_QN_SOLIDFILL = qn('a:solidFill')
+_QN_SRGBCLR = qn('a:srgbClr')
+_QN_PRSTDASH = qn('a:prstDash')
+_QN_NOFILL = qn('a:noFill')
+
+
+def _cell_grid(ppt_table) -> List[list]:
+    """All cells of a python-pptx table as grid[row][col] (one row/cell walk instead of cell(i, j) per access)"""
+    return [list(row.cells) for row in ppt_table.rows]
+
+
+def _set_column_widths(ppt_table, widths: List[int]) -> None:
+    """Write column widths straight to <a:tblGrid> and resize the graphic frame once"""
+    for grid_col, width in zip(ppt_table._tbl.tblGrid.gridCol_lst, widths):
+        grid_col.w = width
+    ppt_table.notify_width_changed()
+
+
+def _style_cell_text(
+    tc,
+    size_cp: int,
+    rgb_hex: str,
+    align,
+    wrap: bool,
+    bold: bool = False,
+    underline: bool = False,
+    line_spacing: Optional[float] = None
+) -> None:
+    """
+    Apply paragraph-level font and alignment to a table cell in one XML pass
+    
+    Writes <a:pPr>/<a:defRPr> directly, producing the same markup as the
+    paragraph.font / paragraph.alignment / text_frame.word_wrap setters.
+    
+    Args:
+        tc: <a:tc> element (_Cell._tc)
+        size_cp: Font size in centipoints
+        rgb_hex: Font color as 'RRGGBB'
+        align: PP_ALIGN value
+        wrap: Whether text wraps
+        bold: Set bold
+        underline: Set single underline
+        line_spacing: Line spacing multiple (unchanged if None)
+    """
+    txBody = tc.get_or_add_txBody()
+    txBody.bodyPr.wrap = 'square' if wrap else 'none'
+    for p in txBody.p_lst:
+        pPr = p.get_or_add_pPr()
+        defRPr = pPr.get_or_add_defRPr()
+        defRPr.sz = size_cp
+        if bold:
+            defRPr.b = True
+        defRPr.get_or_change_to_solidFill().get_or_change_to_srgbClr().val = rgb_hex
+        if underline:
+            defRPr.u = MSO_UNDERLINE.SINGLE_LINE
+        pPr.algn = align
+        if line_spacing is not None:
+            pPr.line_spacing = line_spacing
+
+
+def _style_link_runs(tc, rgb_hex: str) -> None:
+    """Color and underline every run of a table cell (hyperlink style)"""
+    for p in tc.get_or_add_txBody().p_lst:
+        for r in p.r_lst:
+            rPr = r.get_or_add_rPr()
+            rPr.get_or_change_to_solidFill().get_or_change_to_srgbClr().val = rgb_hex
+            rPr.u = MSO_UNDERLINE.SINGLE_LINE
+
 
 class TableDataExtractor:
     """Class that extracts data from HTML tables"""
@@ -38,48 +118,75 @@ class TableDataExtractor:
         self.cell_styles: Dict[Tuple[int, int], Dict[str, Any]] = {}
         self.has_header = False
         self.max_cols = 0
+        self.header_row_count = 0
+        self.body_row_count = 0
+        self._header_trs: Optional[List[Tag]] = None
+        self._body_trs: List[Tag] = []
+        self._row_cells: List[List[Tag]] = []  # th/td per tr, header rows first
+        self._extracted = False
     
-    def extract(self) -> 'TableDataExtractor':
-        """Extract table data"""
+    def extract_shape(self) -> 'TableDataExtractor':
+        """
+        Cheap first stage: locate rows and measure the table without reading cell text or styles
+        
+        Sets has_header, header_row_count, body_row_count and max_cols, which
+        is enough for is_key_value_table(), the split decision and grouping.
+        """
+        if self._header_trs is not None:
+            return self
+        
         thead = self.table_elem.find('thead')
         tbody = self.table_elem.find('tbody')
         
-        # Process thead
-        if thead:
-            self.has_header = True
-            header_trs = thead.find_all('tr')
-            for tr in header_trs:
-                row_data = self._extract_row_data(tr, len(self.rows_data))
-                self.header_rows.append(row_data)
-                self.rows_data.append(row_data)
-                
-                if not self.col_widths_html:
-                    cells = tr.find_all(['th', 'td'])
-                    self.col_widths_html = StyleExtractor.extract_column_widths(cells)
+        self._header_trs = thead.find_all('tr') if thead else []
+        self.has_header = bool(thead)
+        self.header_row_count = len(self._header_trs)
         
-        # Process tbody
         if tbody:
-            body_trs = tbody.find_all('tr')
-            for idx, tr in enumerate(body_trs):
-                row_data = self._extract_row_data(tr, len(self.rows_data))
-                self.body_rows.append(row_data)
-                self.rows_data.append(row_data)
-                
-                if not self.has_header and idx == 0 and not self.col_widths_html:
-                    cells = tr.find_all(['th', 'td'])
-                    self.col_widths_html = StyleExtractor.extract_column_widths(cells)
+            self._body_trs = tbody.find_all('tr')
+        elif not self.has_header:
+            # If neither thead nor tbody exists (use tr directly)
+            self._body_trs = self.table_elem.find_all('tr')
+        self.body_row_count = len(self._body_trs)
+        
+        # Collect each row's cells once; extract() reuses them
+        self._row_cells = [tr.find_all(['th', 'td']) for tr in self._header_trs + self._body_trs]
+        
+        # Column count including colspan (same as the padded row width after
+        # extract(); _extract_row_data emits at least one column per cell)
+        for cells in self._row_cells:
+            width = sum(max(1, int(cell.get('colspan', 1))) for cell in cells)
+            if width > self.max_cols:
+                self.max_cols = width
         
-        # If neither thead nor tbody exists (use tr directly)
-        if not self.has_header and not tbody:
-            all_rows = self.table_elem.find_all('tr')
-            for idx, tr in enumerate(all_rows):
-                row_data = self._extract_row_data(tr, len(self.rows_data))
-                self.body_rows.append(row_data)
-                self.rows_data.append(row_data)
-                
-                if idx == 0 and not self.col_widths_html:
-                    cells = tr.find_all(['th', 'td'])
-                    self.col_widths_html = StyleExtractor.extract_column_widths(cells)
+        return self
+    
+    def extract(self) -> 'TableDataExtractor':
+        """Extract table data (runs extract_shape() first if needed; safe to call twice)"""
+        if self._extracted:
+            return self
+        self.extract_shape()
+        self._extracted = True
+        
+        header_count = len(self._header_trs)
+        
+        # Process thead
+        for cells in self._row_cells[:header_count]:
+            row_data = self._extract_row_data(cells, len(self.rows_data))
+            self.header_rows.append(row_data)
+            self.rows_data.append(row_data)
+            
+            if not self.col_widths_html:
+                self.col_widths_html = StyleExtractor.extract_column_widths(cells)
+        
+        # Process tbody (or bare tr rows)
+        for idx, cells in enumerate(self._row_cells[header_count:]):
+            row_data = self._extract_row_data(cells, len(self.rows_data))
+            self.body_rows.append(row_data)
+            self.rows_data.append(row_data)
+            
+            if not self.has_header and idx == 0 and not self.col_widths_html:
+                self.col_widths_html = StyleExtractor.extract_column_widths(cells)
         
         # Determine and normalize column count
         if self.rows_data:
@@ -90,9 +197,8 @@ class TableDataExtractor:
         
         return self
     
-    def _extract_row_data(self, tr: Tag, row_idx: int) -> List[str]:
-        """Extract row data (including colspan handling)"""
-        cells = tr.find_all(['th', 'td'])
+    def _extract_row_data(self, cells: List[Tag], row_idx: int) -> List[str]:
+        """Extract row data from a row's th/td cells (including colspan handling)"""
         row_data = []
         col_idx = 0
         
@@ -122,16 +228,10 @@ class TableDataExtractor:
         return row_data
     
     def is_key_value_table(self) -> bool:
-        """Check if the table is a key-value table"""
-        if self.has_header:
-            return False
-        if len(self.body_rows) > 5:
-            return False
-        if not self.body_rows:
-            return False
-        
-        first_row = self.body_rows[0]
-        return len(first_row) == 2
+        """Check if the table is a key-value table (only needs extract_shape())"""
+        # No header, 1-5 body rows, two columns (every row is padded to max_cols,
+        # so this is also the first row's width)
+        return not self.has_header and 0 < self.body_row_count <= 5 and self.max_cols == 2
 
 
 class TableBorderStyler:
@@ -144,15 +244,25 @@ class TableBorderStyler:
     ):
         self.border_config = border_config or DEFAULT_BORDER_CONFIG
         self.colors = colors or DEFAULT_COLORS
+        # Detached border line per (width, color), copied for each cell side
+        self._ln_templates: Dict[Tuple[int, RGBColor], Any] = {}
     
     def apply_academic_borders(
         self, 
         ppt_table, 
         header_count: int, 
         row_count: int, 
-        col_count: int
+        col_count: int,
+        grid: Optional[List[list]] = None
     ) -> None:
-        """Apply academic paper style borders (thick lines at top/bottom, thick line below header)"""
+        """
+        Apply academic paper style borders (thick lines at top/bottom, thick line below header)
+        
+        grid is the table's _cell_grid(), if the caller already has it.
+        """
+        if grid is None:
+            grid = _cell_grid(ppt_table)
+        
         thick_line = self.border_config.thick_line
         thin_line = self.border_config.thin_line
         no_line = self.border_config.no_line
@@ -160,59 +270,70 @@ class TableBorderStyler:
         black = self.colors['black']
         gray_line = self.colors['gray_line']
         
-        for i in range(row_count):
-            for j in range(col_count):
+        for i, grid_row in enumerate(grid[:row_count]):
+            # Top line
+            if i == 0:
+                top = ('top', thick_line, black)
+            elif i == header_count and header_count > 0:
+                top = ('top', no_line, black)
+            else:
+                top = ('top', thin_line, gray_line)
+            
+            # Bottom line
+            if i == row_count - 1:
+                bottom = ('bottom', thick_line, black)
+            elif i == header_count - 1 and header_count > 0:
+                bottom = ('bottom', thick_line, black)
+            else:
+                bottom = ('bottom', thin_line, gray_line)
+            
+            # No left/right borders; every cell in the row gets the same four lines
+            borders = [top, bottom, ('left', no_line, black), ('right', no_line, black)]
+            
+            for cell in grid_row[:col_count]:
                 try:
-                    cell = ppt_table.cell(i, j)
-                    
-                    # Top line
-                    if i == 0:
-                        self._set_cell_border(cell, 'top', thick_line, black)
-                    elif i == header_count and header_count > 0:
-                        self._set_cell_border(cell, 'top', no_line, black)
-                    else:
-                        self._set_cell_border(cell, 'top', thin_line, gray_line)
-                    
-                    # Bottom line
-                    if i == row_count - 1:
-                        self._set_cell_border(cell, 'bottom', thick_line, black)
-                    elif i == header_count - 1 and header_count > 0:
-                        self._set_cell_border(cell, 'bottom', thick_line, black)
-                    else:
-                        self._set_cell_border(cell, 'bottom', thin_line, gray_line)
-                    
-                    # No left/right borders
-                    self._set_cell_border(cell, 'left', no_line, black)
-                    self._set_cell_border(cell, 'right', no_line, black)
-                    
+                    self._set_cell_borders(cell, borders)
                 except Exception:
                     pass
     
-    def _set_cell_border(self, cell, side: str, width: int, color: RGBColor) -> None:
-        """Set specific border of a cell"""
-        tc = cell._tc
-        tcPr = tc.get_or_add_tcPr()
+    def _set_cell_borders(self, cell, borders: List[Tuple[str, int, RGBColor]]) -> None:
+        """Set several borders of a cell in one tcPr update (borders: [(side, width, color), ...])"""
+        tcPr = cell._tc.get_or_add_tcPr()
         
-        border_map = {
-            'top': 'a:lnT',
-            'bottom': 'a:lnB',
-            'left': 'a:lnL',
-            'right': 'a:lnR'
-        }
-        
-        border_elem_name = border_map.get(side)
-        if not border_elem_name:
-            return
+        lines = [self._border_elem(side, width, color) for side, width, color in borders]
         
-        # Remove existing border elements
-        for existing in list(tcPr):
-            if existing.tag == qn(border_elem_name):
-                tcPr.remove(existing)
+        # Remove existing border elements for those sides in one sweep
+        tags = {ln.tag for ln in lines}
+        for existing in [e for e in tcPr if e.tag in tags]:
+            tcPr.remove(existing)
         
+        # Same resulting order as inserting each border at index 0 in turn
+        lines.reverse()
+        tcPr[0:0] = lines
+    
+    def _set_cell_border(self, cell, side: str, width: int, color: RGBColor) -> None:
+        """Set specific border of a cell"""
+        if side not in _BORDER_TAGS:
+            return
+        self._set_cell_borders(cell, [(side, width, color)])
+    
+    def _border_elem(self, side: str, width: int, color: RGBColor):
+        """Copy of the cached line template for (width, color), tagged for side"""
+        key = (width, color)
+        template = self._ln_templates.get(key)
+        if template is None:
+            template = self._ln_templates[key] = self._build_border_elem(side, width, color)
+        ln = deepcopy(template)
+        ln.tag = _BORDER_TAGS[side]
+        return ln
+    
+    @staticmethod
+    def _build_border_elem(side: str, width: int, color: RGBColor):
+        """Detached a:lnT/lnB/lnL/lnR element for one border"""
         width_emu = int(width) if width > 0 else 0
         
         # Create new border element
-        ln = etree.Element(qn(border_elem_name))
+        ln = etree.Element(_BORDER_TAGS[side])
         
         if width_emu > 0:
             ln.set('w', str(width_emu))
@@ -220,17 +341,17 @@ class TableBorderStyler:
             ln.set('cmpd', 'sng')
             ln.set('algn', 'ctr')
             
-            solidFill = etree.SubElement(ln, qn('a:solidFill'))
-            srgbClr = etree.SubElement(solidFill, qn('a:srgbClr'))
+            solidFill = etree.SubElement(ln, _QN_SOLIDFILL)
+            srgbClr = etree.SubElement(solidFill, _QN_SRGBCLR)
             srgbClr.set('val', '%02X%02X%02X' % (color[0], color[1], color[2]))
             
-            prstDash = etree.SubElement(ln, qn('a:prstDash'))
+            prstDash = etree.SubElement(ln, _QN_PRSTDASH)
             prstDash.set('val', 'solid')
         else:
             ln.set('w', '0')
-            etree.SubElement(ln, qn('a:noFill'))
+            etree.SubElement(ln, _QN_NOFILL)
         
-        tcPr.insert(0, ln)
+        return ln
 
 
 class TableColumnAdjuster:
@@ -248,50 +369,47 @@ class TableColumnAdjuster:
             if col_count == 0:
                 return
             
-            specified_widths = [w for w in col_widths_html if w is not None]
-            unspecified_count = col_widths_html.count(None)
-            
-            if not specified_widths:
-                return
-            
             html_to_ppt_ratio = total_width / 900
             
-            specified_total_ppt = sum(
-                int(w * html_to_ppt_ratio) 
-                for w in col_widths_html if w is not None
-            )
+            # One pass over the HTML widths for all the totals
+            specified_total_html = 0
+            specified_total_ppt = 0
+            unspecified_count = 0
+            for w in col_widths_html:
+                if w is None:
+                    unspecified_count += 1
+                else:
+                    specified_total_html += w
+                    specified_total_ppt += int(w * html_to_ppt_ratio)
+            
+            if unspecified_count == col_count:
+                return
             
             remaining_width = total_width - specified_total_ppt
             
             if remaining_width < 0 or (
                 unspecified_count > 0 and remaining_width < total_width * 0.3
             ):
+                # Specified columns share a fixed portion in HTML proportion
                 specified_portion = 0.3 if unspecified_count > 0 else 1.0
-                total_specified_html = sum(specified_widths)
-                
-                for j, html_width in enumerate(col_widths_html):
-                    if html_width is not None:
-                        proportion = html_width / total_specified_html
-                        ppt_table.columns[j].width = int(
-                            total_width * specified_portion * proportion
-                        )
-                
-                if unspecified_count > 0:
-                    remaining = total_width * (1 - specified_portion)
-                    equal_width = int(remaining / unspecified_count)
-                    for j, html_width in enumerate(col_widths_html):
-                        if html_width is None:
-                            ppt_table.columns[j].width = equal_width
+                specified_width = total_width * specified_portion
+                equal_width = (
+                    int(total_width * (1 - specified_portion) / unspecified_count)
+                    if unspecified_count else 0
+                )
+                widths = [
+                    equal_width if w is None
+                    else int(specified_width * (w / specified_total_html))
+                    for w in col_widths_html
+                ]
             else:
-                for j, html_width in enumerate(col_widths_html):
-                    if html_width is not None:
-                        ppt_table.columns[j].width = int(html_width * html_to_ppt_ratio)
-                
-                if unspecified_count > 0:
-                    equal_width = int(remaining_width / unspecified_count)
-                    for j, html_width in enumerate(col_widths_html):
-                        if html_width is None:
-                            ppt_table.columns[j].width = equal_width
+                equal_width = int(remaining_width / unspecified_count) if unspecified_count else 0
+                widths = [
+                    equal_width if w is None else int(w * html_to_ppt_ratio)
+                    for w in col_widths_html
+                ]
+            
+            _set_column_widths(ppt_table, widths)
         
         except Exception as e:
             logger.debug(f"Failed to apply HTML width: {e}")
@@ -304,16 +422,16 @@ class TableColumnAdjuster:
             if col_count == 0:
                 return
             
-            total_table_width = sum(col.width for col in ppt_table.columns)
+            total_table_width = sum(grid_col.w for grid_col in ppt_table._tbl.tblGrid.gridCol_lst)
             
             max_lengths = [0] * col_count
             for row in rows_data:
                 for j, cell in enumerate(row):
                     cell_text = str(cell)
-                    korean_count = len([
-                        c for c in cell_text 
-                        if ord(c) >= 0xAC00 and ord(c) <= 0xD7A3
-                    ])
+                    if cell_text.isascii():
+                        korean_count = 0
+                    else:
+                        korean_count = len(cell_text) - len(_HANGUL_RE.sub('', cell_text))
                     english_count = len(cell_text) - korean_count
                     weighted_length = english_count + (korean_count * 1.8)
                     max_lengths[j] = max(max_lengths[j], weighted_length)
@@ -322,14 +440,13 @@ class TableColumnAdjuster:
             total_length = sum(max_lengths)
             
             if total_length == 0:
-                equal_width = total_table_width // col_count
-                for j in range(col_count):
-                    ppt_table.columns[j].width = equal_width
+                _set_column_widths(ppt_table, [total_table_width // col_count] * col_count)
                 return
             
-            for j in range(col_count):
-                proportion = max(max_lengths[j] / total_length, min_proportion)
-                ppt_table.columns[j].width = int(total_table_width * proportion)
+            _set_column_widths(ppt_table, [
+                int(total_table_width * max(length / total_length, min_proportion))
+                for length in max_lengths
+            ])
         
         except Exception as e:
             logger.debug(f"Failed to adjust column widths: {e}")
@@ -393,75 +510,81 @@ class TableBuilder:
                 row_count, max_cols,
                 left, top, width, height
             ).table
+            grid = _cell_grid(ppt_table)
             
-            # Fill data
+            # Loop invariants for the fill loop
+            margin_lr = self.table_config.cell_margin
+            margin_tb = self.table_config.cell_margin_vertical
+            header_size_cp = header_font_size.centipoints
+            base_size_cp = base_font_size.centipoints
+            black_hex = str(self.colors['black'])
+            gray_800_hex = str(self.colors['gray_800'])
+            link_blue_hex = str(self.colors['link_blue'])
+            align_center = PP_ALIGN.CENTER
+            align_left = PP_ALIGN.LEFT
+            anchor_middle = MSO_ANCHOR.MIDDLE
+            no_style = {}
+            
+            # Fill data; cell properties are written straight to <a:tcPr>/<a:pPr>
+            # (same markup as the python-pptx cell/paragraph setters)
             for i, row_data in enumerate(rows_data):
-                for j, cell_data in enumerate(row_data):
-                    if j >= max_cols:
-                        continue
+                grid_row = grid[i]
+                is_header = i < header_count
+                # zip() stops at the table width (rows from TableDataExtractor
+                # are already padded to max_cols and hold str cell text)
+                for j, (cell, cell_data) in enumerate(zip(grid_row, row_data)):
+                    cell.text = cell_data
                     
-                    cell = ppt_table.cell(i, j)
-                    cell.text = str(cell_data) if j < len(row_data) else ""
-                    cell.vertical_anchor = MSO_ANCHOR.MIDDLE
+                    tc = cell._tc
+                    tcPr = tc.get_or_add_tcPr()
+                    tcPr.anchor = anchor_middle
+                    tcPr.marL = margin_lr
+                    tcPr.marR = margin_lr
+                    tcPr.marT = margin_tb
+                    tcPr.marB = margin_tb
+                    tcPr.get_or_change_to_noFill()
                     
-                    cell.margin_left = self.table_config.cell_margin
-                    cell.margin_right = self.table_config.cell_margin
-                    cell.margin_top = self.table_config.cell_margin_vertical
-                    cell.margin_bottom = self.table_config.cell_margin_vertical
-                    
-                    cell.fill.background()
+                    if is_header:
+                        _style_cell_text(
+                            tc, header_size_cp, black_hex, align_center,
+                            wrap=False, bold=True, line_spacing=1.1
+                        )
+                        continue
                     
-                    html_style = cell_styles.get((i, j), {})
-                    has_custom_bold = html_style.get('bold', False)
-                    custom_color = html_style.get('color')
+                    html_style = cell_styles.get((i, j), no_style)
                     has_link = html_style.get('link')
+                    if has_link:
+                        text_hex = link_blue_hex
+                    else:
+                        custom_color = html_style.get('color')
+                        text_hex = str(custom_color) if custom_color else gray_800_hex
                     
-                    for paragraph in cell.text_frame.paragraphs:
-                        if i < header_count:
-                            paragraph.font.size = header_font_size
-                            paragraph.font.bold = True
-                            paragraph.font.color.rgb = self.colors['black']
-                            paragraph.alignment = PP_ALIGN.CENTER
-                            cell.text_frame.word_wrap = False
-                        else:
-                            paragraph.font.size = base_font_size
-                            
-                            if has_custom_bold:
-                                paragraph.font.bold = True
-                            
-                            if custom_color:
-                                paragraph.font.color.rgb = custom_color
-                            else:
-                                paragraph.font.color.rgb = self.colors['gray_800']
-                            
-                            if has_link:
-                                paragraph.font.color.rgb = self.colors['link_blue']
-                                paragraph.font.underline = True
-                            
-                            # Left-align if bullet(•) present, otherwise center-align
-                            if '•' in cell_data or '\n' in cell_data:
-                                paragraph.alignment = PP_ALIGN.LEFT
-                            else:
-                                paragraph.alignment = PP_ALIGN.CENTER
-                            
-                            cell.text_frame.word_wrap = True
-                        
-                        paragraph.line_spacing = 1.1
+                    # Left-align if bullet(•) present, otherwise center-align
+                    if '•' in cell_data or '\n' in cell_data:
+                        alignment = align_left
+                    else:
+                        alignment = align_center
+                    
+                    _style_cell_text(
+                        tc, base_size_cp, text_hex, alignment, wrap=True,
+                        bold=html_style.get('bold', False), underline=bool(has_link),
+                        line_spacing=1.1
+                    )
             
             # Apply borders
             self.border_styler.apply_academic_borders(
-                ppt_table, header_count, row_count, max_cols
+                ppt_table, header_count, row_count, max_cols, grid
             )
             
             # Apply cell merge
             for row_idx, col_idx, colspan, rowspan in merge_info:
                 try:
                     if row_idx < row_count and col_idx < max_cols:
-                        start_cell = ppt_table.cell(row_idx, col_idx)
+                        start_cell = grid[row_idx][col_idx]
                         end_row = min(row_idx + rowspan - 1, row_count - 1)
                         end_col = min(col_idx + colspan - 1, max_cols - 1)
                         
-                        end_cell = ppt_table.cell(end_row, end_col)
+                        end_cell = grid[end_row][end_col]
                         start_cell.merge(end_cell)
                         
                         for paragraph in start_cell.text_frame.paragraphs:
@@ -5,8 +5,24 @@ import pytest
 from pathlib import Path
 import tempfile
 import shutil
+import base64
+import zipfile
+from io import BytesIO
+
+from bs4 import BeautifulSoup
+from PIL import Image
+from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
 
 from preforge.converters.html_to_pptx import HtmlToPptxConverter, convert_html_to_pptx
+from preforge.converters.html_pptx.config import ColorPalette
+from preforge.converters.html_pptx.slide_factory import (
+    EvidenceSlideBuilder,
+    ImageSlideBuilder,
+    TableSlideBuilder
+)
+from preforge.converters.html_pptx.style_utils import StyleExtractor, TextUtils
+from preforge.converters.html_pptx.table_builder import TableDataExtractor
 
 
 class TestHtmlToPptxConverter:
@@ -74,6 +90,13 @@ class TestHtmlToPptxConverter:
         assert converter.colors is not None
         assert 'primary_red' in converter.colors
     
+    def test_color_palette_membership(self):
+        """'in' checks palette keys (unknown keys still index to black)"""
+        palette = ColorPalette()
+        assert 'primary_red' in palette
+        assert 'no_such_color' not in palette
+        assert palette['no_such_color'] == palette['black']
+    
     def test_convert_basic_html(self, sample_html, temp_dir):
         """Basic HTML conversion test"""
         output_path = temp_dir / "output.pptx"
@@ -95,6 +118,27 @@ class TestHtmlToPptxConverter:
         assert output_path.exists()
         assert output_path.stat().st_size > 0
     
+    def test_titles_keep_inline_markup_joined(self, temp_dir):
+        """Titles join inline children without inserting spaces"""
+        html_path = temp_dir / "inline.html"
+        html_path.write_text(
+            """
+            <html><body>
+                <div class="header-title">IL-<sub>6</sub> <b>Gene</b>s</div>
+                <div class="header-subtitle"><i>Sub</i>title</div>
+            </body></html>
+            """,
+            encoding='utf-8'
+        )
+        output_path = temp_dir / "inline.pptx"
+        
+        convert_html_to_pptx(html_path, output_path)
+        
+        title_slide = Presentation(str(output_path)).slides[0]
+        texts = [shape.text_frame.text for shape in title_slide.shapes if shape.has_text_frame]
+        assert "IL-6Genes" in texts
+        assert "Subtitle" in texts
+    
     def test_convert_real_file(self, temp_dir):
         """Real file conversion test (only if file exists)"""
         real_file = Path("private/07_타겟_converted.html")
@@ -110,23 +154,323 @@ class TestHtmlToPptxConverter:
         assert output_path.exists()
         assert output_path.stat().st_size > 0
     
+    @pytest.mark.parametrize("rows", [
+        "<tr><td>a</td><td>b</td></tr>",
+        "<tr><td colspan=\"2\">a</td></tr><tr><td>b</td><td>c</td><td>d</td></tr>",
+        "<tr><td colspan=\"0\">a</td><td>b</td></tr>",
+        "<tr><td colspan=\"0\">a</td><td>b</td><td>c</td></tr>",
+        "<tr><td colspan=\"-3\">a</td><td colspan=\"3\">b</td></tr>",
+        "<thead><tr><th colspan=\"0\">h</th><th>i</th></tr></thead><tbody><tr><td>a</td></tr></tbody>",
+    ])
+    def test_extract_shape_matches_extract(self, rows):
+        """extract_shape() measures the same column count extract() produces"""
+        table = BeautifulSoup(f"<table>{rows}</table>", 'lxml').table
+        
+        shape = TableDataExtractor(table).extract_shape()
+        measured = (shape.max_cols, shape.is_key_value_table())
+        extracted = TableDataExtractor(table).extract()
+        
+        assert measured == (extracted.max_cols, extracted.is_key_value_table())
+        assert extracted.max_cols == len(extracted.rows_data[0])
+    
+    def test_key_value_cards(self):
+        """Key-value card shapes (later cards are copies of the first)"""
+        table = BeautifulSoup(
+            "<table><tbody>"
+            "<tr><td>Item1</td><td>Value1</td></tr>"
+            "<tr><td>Item2</td><td>A &amp; B</td></tr>"
+            "<tr><td>Item3</td><td>Value3</td></tr>"
+            "</tbody></table>",
+            'lxml'
+        ).table
+        
+        slide = TableSlideBuilder(Presentation()).create_from_html(table, "Title")[0]
+        cards = [shape for shape in slide.shapes if shape.name.startswith("Rectangle")]
+        
+        assert [shape.text_frame.text for shape in cards] == [
+            "Item1", "Value1", "Item2", "A & B", "Item3", "Value3"
+        ]
+        
+        shape_ids = [shape.shape_id for shape in slide.shapes]
+        assert len(shape_ids) == len(set(shape_ids))
+        
+        # Copies keep the template's size, fill and font; only the top moves
+        for label, value in zip(cards[2::2], cards[3::2]):
+            assert label.top == value.top > cards[0].top
+            assert (label.left, label.width) == (cards[0].left, cards[0].width)
+            assert label.fill.fore_color.rgb == cards[0].fill.fore_color.rgb
+            assert value.line.color.rgb == cards[1].line.color.rgb
+            assert value.text_frame.paragraphs[0].font.size == cards[1].text_frame.paragraphs[0].font.size
+    
+    def test_evidence_nested_cells(self):
+        """Evidence texts of a nested evidence-cell also belong to the outer cell"""
+        evidence_div = BeautifulSoup(
+            """
+            <div class="evidence-table">
+                <div class="evidence-header"><span>Study</span><span>Finding</span></div>
+                <div class="evidence-row">
+                    <div class="evidence-cell">
+                        <div class="evidence-text">Outer A</div>
+                        <div class="evidence-cell">
+                            <div class="evidence-text">Inner B</div>
+                            <div class="evidence-text"><a href="https://example.com/c">Link C</a></div>
+                        </div>
+                        <div class="evidence-text">Outer D</div>
+                    </div>
+                    <div class="evidence-cell"><div class="evidence-text">Second E</div></div>
+                </div>
+            </div>
+            """,
+            'lxml'
+        ).div
+        
+        slide = EvidenceSlideBuilder(Presentation()).create(evidence_div, "Evidence")
+        table = next(shape.table for shape in slide.shapes if shape.has_table)
+        
+        # Same rows as the original per-cell find_all() extraction
+        assert [[cell.text for cell in row.cells] for row in table.rows] == [
+            ["Study", "Finding", "", ""],
+            ["Outer A", "Inner B", "Link C", "Outer D"],
+            ["Inner B", "Link C", "", ""],
+            ["Second E", "", "", ""],
+        ]
+    
+    def test_create_from_raw_html(self):
+        """Only top-level tables of a raw page become slides"""
+        raw_html = """
+        <!DOCTYPE html>
+        <html>
+        <head>
+            <style>table { color: red; }</style>
+            <script>var t = "<table><tr><td>Scripted</td></tr></table>";</script>
+        </head>
+        <body>
+            <div class="layout">
+                <p>Intro paragraph</p>
+                <table class="data-table">
+                    <thead><tr><th>Gene</th><th>Effect</th><th>Note</th></tr></thead>
+                    <tbody>
+                        <tr>
+                            <td>ABC</td>
+                            <td><table><tr><td>Inner1</td><td>Inner2</td></tr></table></td>
+                            <td>Note1</td>
+                        </tr>
+                        <tr><td>DEF</td><td>Up</td><td>Note2</td></tr>
+                    </tbody>
+                </table>
+                <p>Between tables</p>
+                <table><tbody>
+                    <tr><td>Key1</td><td>Value1</td></tr>
+                    <tr><td>Key2</td><td>Value2</td></tr>
+                </tbody></table>
+            </div>
+            <footer>Footer</footer>
+        </body>
+        </html>
+        """
+        
+        def slide_texts(slide):
+            texts = []
+            for shape in slide.shapes:
+                if shape.has_table:
+                    texts.extend(cell.text for row in shape.table.rows for cell in row.cells)
+                elif shape.has_text_frame:
+                    texts.append(shape.text_frame.text)
+            return texts
+        
+        builder = TableSlideBuilder(Presentation())
+        slides = builder.create_from_raw_html(raw_html, "Title", "Main")
+        
+        # The nested table stays inside its parent's slide
+        assert len(slides) == 2
+        texts = [slide_texts(slide) for slide in slides]
+        assert "Inner1" in texts[0] and "Note2" in texts[0]
+        assert texts[1][2:] == ["Key1", "Value1", "Key2", "Value2"]
+        
+        # Surrounding markup never reaches a slide
+        for text in sum(texts, []):
+            for outside in ["Intro", "Between", "Footer", "Scripted", "color: red"]:
+                assert outside not in text
+        
+        # Same slides as building from a full parse's top-level tables
+        soup = BeautifulSoup(raw_html, 'lxml')
+        expected = [
+            slide_texts(slide)
+            for table in soup.find_all('table') if table.find_parent('table') is None
+            for slide in builder.create_from_html(table, "Title", "Main")
+        ]
+        assert texts == expected
+    
+    @staticmethod
+    def _encode_image(fmt, size, **save_kwargs):
+        """Encode a solid test image with PIL"""
+        buffer = BytesIO()
+        Image.new('RGB', size, (200, 30, 30)).save(buffer, format=fmt, **save_kwargs)
+        return buffer.getvalue()
+    
+    @staticmethod
+    def _img_tag(mime, data):
+        """<img> tag carrying a base64 data URI"""
+        src = f"data:{mime};base64,{base64.b64encode(data).decode('ascii')}"
+        return BeautifulSoup(f'<img src="{src}">', 'lxml').img
+    
+    @staticmethod
+    def _media_names(prs):
+        """Media part names of a saved presentation"""
+        buffer = BytesIO()
+        prs.save(buffer)
+        with zipfile.ZipFile(buffer) as package:
+            return [name for name in package.namelist() if name.startswith('ppt/media/')]
+    
+    @pytest.mark.parametrize("mime, fmt, save_kwargs", [
+        ('image/png', 'PNG', {}),
+        ('image/jpeg', 'JPEG', {}),
+        ('image/jpeg', 'JPEG', {'progressive': True}),
+        ('image/jpg', 'JPEG', {'progressive': True, 'optimize': True}),
+        ('image/gif', 'GIF', {}),
+    ])
+    def test_image_slide_embeds_sniffed_formats(self, mime, fmt, save_kwargs):
+        """PNG, baseline/progressive JPEG and GIF are embedded as-is at PIL's aspect ratio"""
+        builder = ImageSlideBuilder(Presentation())
+        
+        for size in [(1, 1), (37, 911), (640, 480), (4000, 3)]:
+            data = self._encode_image(fmt, size, **save_kwargs)
+            assert Image.open(BytesIO(data)).size == size
+            
+            slide = builder.create_from_base64(self._img_tag(mime, data), "Chart")
+            picture = next(shape for shape in slide.shapes if shape.shape_type == MSO_SHAPE_TYPE.PICTURE)
+            
+            assert picture.image.blob == data
+            assert picture.width / picture.height == pytest.approx(size[0] / size[1], rel=1e-3)
+    
+    def test_image_slide_rejects_bad_data(self):
+        """Truncated or garbage payloads create no slide"""
+        prs = Presentation()
+        builder = ImageSlideBuilder(prs)
+        
+        png = self._encode_image('PNG', (64, 48))
+        jpeg = self._encode_image('JPEG', (64, 48))
+        progressive = self._encode_image('JPEG', (64, 48), progressive=True)
+        gif = self._encode_image('GIF', (64, 48))
+        
+        bad_payloads = [
+            # Truncated before the size fields
+            ('image/png', png[:20]),
+            ('image/png', png[:8]),
+            ('image/jpeg', jpeg[:2]),
+            ('image/jpeg', jpeg[:jpeg.find(b'\xff\xc0')]),
+            ('image/jpeg', progressive[:progressive.find(b'\xff\xc2') + 6]),
+            ('image/gif', gif[:8]),
+        ]
+        # Garbage and empty payloads
+        for mime in ['image/png', 'image/jpeg', 'image/gif']:
+            bad_payloads.append((mime, b''))
+            bad_payloads.append((mime, b'not an image at all, just some bytes'))
+        
+        for mime, data in bad_payloads:
+            assert builder.create_from_base64(self._img_tag(mime, data), "Chart") is None
+        assert len(prs.slides) == 0
+    
+    @pytest.mark.parametrize("mime, fmt", [
+        ('image/jpeg', 'PNG'),
+        ('image/gif', 'PNG'),
+        ('image/png', 'JPEG'),
+        ('image/gif', 'JPEG'),
+        ('image/png', 'GIF'),
+        ('image/jpeg', 'GIF'),
+        ('image/webp', 'PNG'),
+    ])
+    def test_image_slide_mislabelled_mime(self, mime, fmt):
+        """Bytes that do not match the MIME type are decoded by PIL and re-encoded as PNG"""
+        data = self._encode_image(fmt, (64, 48))
+        slide = ImageSlideBuilder(Presentation()).create_from_base64(self._img_tag(mime, data), "Chart")
+        picture = next(shape for shape in slide.shapes if shape.shape_type == MSO_SHAPE_TYPE.PICTURE)
+        
+        assert picture.image.content_type == 'image/png'
+        assert picture.image.blob != data
+        assert Image.open(BytesIO(picture.image.blob)).size == (64, 48)
+    
+    def test_repeated_images_share_media(self):
+        """A repeated data URI is embedded once; distinct images each get a media part"""
+        prs = Presentation()
+        builder = ImageSlideBuilder(prs)
+        
+        first = self._img_tag('image/png', self._encode_image('PNG', (1, 10)))
+        for width in range(2, 22):
+            tag = self._img_tag('image/png', self._encode_image('PNG', (width, 10)))
+            assert builder.create_from_base64(tag, "Chart") is not None
+            assert builder.create_from_base64(first, "Chart") is not None
+        
+        assert len(prs.slides) == 40
+        assert len(self._media_names(prs)) == 21
+    
+    @pytest.mark.parametrize("style, color, background, bold", [
+        # 'color:' also matches inside 'background-color:'; the first match wins
+        ("background-color: #112233; color: #445566", "112233", "112233", False),
+        ("color: #445566; background-color: #112233", "445566", "112233", False),
+        # ... and inside 'border-color:'
+        ("border-color: #aabbcc; color: #445566", "AABBCC", None, False),
+        ("color: #445566; border-color: #aabbcc", "445566", None, False),
+        # 'background:' sets only the background, 'background-color:' sets both
+        ("background: #fff", None, "FFFFFF", False),
+        ("background: #fff; color: rgb(1, 2, 3)", "010203", "FFFFFF", False),
+        ("background: #fff; background-color: #000", "000000", "FFFFFF", False),
+        ("background-color: #000; background: #fff", "000000", "000000", False),
+        # First font-weight wins
+        ("font-weight: bold; font-weight: normal", None, None, True),
+        ("font-weight: normal; font-weight: bold", None, None, False),
+        ("font-weight: 700", None, None, True),
+        ("font-weight: 600", None, None, False),
+        ("text-align: center", None, None, False),
+    ])
+    def test_extract_cell_styles(self, style, color, background, bold):
+        """Inline cell style parsing: property order, aliases and first-wins"""
+        cell = BeautifulSoup(f'<table><tr><td style="{style}">x</td></tr></table>', 'lxml').td
+        styles = StyleExtractor.extract_cell_styles(cell)
+        
+        assert (str(styles['color']) if styles['color'] else None) == color
+        assert (str(styles['background']) if styles['background'] else None) == background
+        assert styles['bold'] is bold
+    
+    def test_extract_cell_styles_inner_elements(self):
+        """Bold tags, inner span color and links inside the cell"""
+        cell = BeautifulSoup(
+            '<table><tr><td>'
+            '<span style="font-size: 9pt">a</span>'
+            '<span style="color: #00ff00">b</span>'
+            '<strong>c</strong><a href="https://example.com/1">d</a><a href="/2">e</a>'
+            '</td></tr></table>',
+            'lxml'
+        ).td
+        styles = StyleExtractor.extract_cell_styles(cell)
+        
+        # Only the first styled descendant is consulted for color
+        assert styles['color'] is None
+        assert styles['bold'] is True
+        assert styles['link'] == "https://example.com/1"
+        
+        cell = BeautifulSoup(
+            '<table><tr><td style="color: #ff0000"><span style="color: #00ff00">b</span></td></tr></table>',
+            'lxml'
+        ).td
+        # The cell's own color takes precedence
+        assert str(StyleExtractor.extract_cell_styles(cell)['color']) == "FF0000"
+    
     def test_clean_text(self):
         """Text cleaning function test"""
-        converter = HtmlToPptxConverter()
-        
         # Remove consecutive whitespace
         text = "Hello    World"
-        cleaned = converter._clean_text(text)
+        cleaned = TextUtils.clean_text(text)
         assert cleaned == "Hello World"
         
         # Remove leading/trailing whitespace
         text = "  Hello World  "
-        cleaned = converter._clean_text(text)
+        cleaned = TextUtils.clean_text(text)
         assert cleaned == "Hello World"
         
         # Convert newlines to spaces
         text = "Hello\n\nWorld"
-        cleaned = converter._clean_text(text)
+        cleaned = TextUtils.clean_text(text)
         assert cleaned == "Hello World"
 
 